@@ -1,4 +1,9 @@
 """OWL to LinkML/Obsidian conversion toolkit."""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .model import (
     OEnumValue,
     OEnumeration,
@@ -9,13 +14,41 @@ from .model import (
     OIndividual,
     OModel,
 )
-from .note_id import iri_to_note_id
-from .loader import load_owl
-from .linkml_writer import model_to_linkml, write_linkml_yaml
-from .obsidian_writer import write_obsidian_vault
-from .mkdocs_writer import write_mkdocs_docs
-from .docsify_writer import write_docsify_docs
-from .hugo_writer import write_hugo_site
+from .note_id import iri_to_note_id, iri_to_note_ids
+
+if TYPE_CHECKING:
+    from .loader import load_owl, load_owl_from_graph
+    from .linkml_writer import model_to_linkml, write_linkml_yaml
+    from .obsidian_writer import write_obsidian_vault
+    from .mkdocs_writer import write_mkdocs_docs
+    from .docsify_writer import write_docsify_docs
+    from .hugo_writer import write_hugo_site
+
+# Loader and writers pull in rdflib/yaml, so they are imported on first access (PEP 562).
+_LAZY_ATTRS = {
+    "load_owl": "loader",
+    "load_owl_from_graph": "loader",
+    "model_to_linkml": "linkml_writer",
+    "write_linkml_yaml": "linkml_writer",
+    "write_obsidian_vault": "obsidian_writer",
+    "write_mkdocs_docs": "mkdocs_writer",
+    "write_docsify_docs": "docsify_writer",
+    "write_hugo_site": "hugo_writer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "OEnumValue",
@@ -27,7 +60,9 @@ __all__ = [
     "OIndividual",
     "OModel",
     "iri_to_note_id",
+    "iri_to_note_ids",
     "load_owl",
+    "load_owl_from_graph",
     "model_to_linkml",
     "write_linkml_yaml",
     "write_obsidian_vault",
@@ -0,0 +1,89 @@
+"""Helpers shared by the markdown writers."""
+from __future__ import annotations
+
+import re
+from typing import Dict, Optional, Tuple
+
+import yaml
+
+# Scalars that PyYAML would also emit unquoted; anything else is quoted.
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z0-9_./()][A-Za-z0-9 _./()#:+,-]*\Z")
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+_YAML_ESCAPES = {'"': '\\"', "\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+# Markdown table rows; cell text goes through table_cell so a stray pipe or
+# line break cannot split the row.
+SLOT_ROW = "| {} | {} | {} | {} |".format
+ENUM_ROW = "| {} | {} | {} |".format
+# Cardinalities most slots carry, answered with one dict probe.
+_CARDINALITY_TEXT: Dict[Tuple[Optional[int], Optional[int]], str] = {
+    (None, None): "",
+    (0, 1): "0..1",
+    (1, 1): "1",
+    (None, 1): "0..1",
+    (0, None): "0..*",
+    (1, None): "1..*",
+}
+
+_MD_ESCAPE_TABLE = str.maketrans({"|": "\\|", "\r": "", "\n": " "})
+
+
+def format_cardinality(min_card: Optional[int], max_card: Optional[int]) -> str:
+    """Render slot cardinality as ``n``, ``min..max`` or ``min..*``; empty when unbounded."""
+
+    text = _CARDINALITY_TEXT.get((min_card, max_card))
+    if text is not None:
+        return text
+    if min_card is None and max_card is None:
+        return ""
+    if min_card is not None and max_card is not None and min_card == max_card:
+        return str(min_card)
+    min_part = "0" if min_card is None else str(min_card)
+    max_part = "*" if max_card is None else str(max_card)
+    return f"{min_part}..{max_part}"
+
+
+def table_cell(text: Optional[str]) -> str:
+    return (text or "").translate(_MD_ESCAPE_TABLE)
+
+
+def display_sort_key(entity) -> str:
+    """Case-insensitive sort key on an entity's label, falling back to its IRI."""
+
+    return (entity.label or entity.iri).lower()
+
+
+def _yaml_escape(char: str) -> str:
+    # Astral characters stay literal: JSON-style surrogate-pair escapes would load
+    # back from YAML as two lone surrogates.
+    escaped = _YAML_ESCAPES.get(char)
+    if escaped is not None:
+        return escaped
+    if char.isprintable():
+        return char
+    code = ord(char)
+    if code <= 0xFF:
+        return f"\\x{code:02x}"
+    if code <= 0xFFFF:
+        return f"\\u{code:04x}"
+    return f"\\U{code:08x}"
+
+
+def yaml_scalar(text: str) -> str:
+    """Return ``text`` as a one-line YAML scalar that loads back as the same string."""
+
+    if (
+        _PLAIN_SCALAR_RE.match(text)
+        and ": " not in text
+        and " #" not in text
+        and not text.endswith((" ", ":"))
+        and _YAML_RESOLVER.resolve(yaml.ScalarNode, text, (True, False)) == _YAML_STR_TAG
+    ):
+        return text
+    if text.isprintable():
+        return "'" + text.replace("'", "''") + "'"
+    return '"' + "".join(_yaml_escape(char) for char in text) + '"'
+
+
+__all__ = ["ENUM_ROW", "SLOT_ROW", "display_sort_key", "format_cardinality", "table_cell", "yaml_scalar"]
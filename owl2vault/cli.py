@@ -3,9 +3,16 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+import pickle
+import shutil
+import stat
 import tempfile
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from pathlib import Path
+from typing import Callable
 from urllib.parse import urlparse
 
 from .linkml_writer import write_linkml_yaml
@@ -14,10 +21,27 @@ from .obsidian_writer import write_obsidian_vault
 from .mkdocs_writer import write_mkdocs_docs
 from .docsify_writer import write_docsify_docs
 from .hugo_writer import write_hugo_site
+from .model import OModel
 
 
 log = logging.getLogger(__name__)
 
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _download(url: str, target_path: Path) -> None:
+    with urllib.request.urlopen(url) as response, open(target_path, "wb") as fh:
+        shutil.copyfileobj(response, fh, length=_DOWNLOAD_CHUNK_SIZE)
+
+
+def _is_dir(path: Path) -> bool | None:
+    """Return whether ``path`` is a directory, or ``None`` when it does not exist."""
+
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
 
 def _prepare_output_paths(args: argparse.Namespace) -> None:
     missing: list[tuple[Path, str]] = []
@@ -26,21 +50,21 @@ def _prepare_output_paths(args: argparse.Namespace) -> None:
         if not path_value:
             return
         path = Path(path_value)
-        if path.exists():
-            if not path.is_dir():
-                raise SystemExit(f"{label} must be a directory: {path}")
-            return
-        missing.append((path, label))
+        is_dir = _is_dir(path)
+        if is_dir is None:
+            missing.append((path, label))
+        elif not is_dir:
+            raise SystemExit(f"{label} must be a directory: {path}")
 
     if args.linkml:
         linkml_path = Path(args.linkml)
         args.linkml = str(linkml_path)
         parent = linkml_path.parent if str(linkml_path.parent) else Path(".")
-        if parent.exists():
-            if not parent.is_dir():
-                raise SystemExit(f"--linkml parent must be a directory: {parent}")
-        else:
+        is_dir = _is_dir(parent)
+        if is_dir is None:
             missing.append((parent, "--linkml parent directory"))
+        elif not is_dir:
+            raise SystemExit(f"--linkml parent must be a directory: {parent}")
 
     _check_dir(args.vault, "--vault")
     _check_dir(args.mkdocs, "--mkdocs")
@@ -64,6 +88,55 @@ def _prepare_output_paths(args: argparse.Namespace) -> None:
         log.info("Created missing directory for %s: %s", label, path)
 
 
+def _writer_tasks(args: argparse.Namespace) -> list[tuple[str, Callable[[OModel, str], None], str]]:
+    tasks: list[tuple[str, Callable[[OModel, str], None], str]] = []
+    if args.linkml:
+        tasks.append(("Writing LinkML YAML to %s", write_linkml_yaml, args.linkml))
+    if args.vault:
+        tasks.append(("Writing Obsidian vault to %s", write_obsidian_vault, args.vault))
+    if args.mkdocs:
+        tasks.append(("Writing MkDocs documentation to %s", write_mkdocs_docs, args.mkdocs))
+    if args.docsify:
+        tasks.append(("Writing Docsify documentation to %s", write_docsify_docs, args.docsify))
+    if args.hugo:
+        tasks.append(("Writing Hugo site to %s", write_hugo_site, args.hugo))
+    return tasks
+
+
+def _run_shared_writer(
+    shm_name: str, size: int, writer: Callable[[OModel, str], None], target: str
+) -> None:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf[:size] as payload:
+            model = pickle.loads(payload)
+    finally:
+        shm.close()
+    writer(model, target)
+
+
+def _run_writers_parallel(
+    model: OModel, tasks: list[tuple[str, Callable[[OModel, str], None], str]]
+) -> None:
+    # Each writer targets its own output path and only reads the model. The model is
+    # pickled once into shared memory so workers do not each receive a copy over IPC.
+    payload = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+    shm = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+    try:
+        shm.buf[: len(payload)] = payload
+        workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for message, writer, target in tasks:
+                log.info(message, target)
+                futures.append(executor.submit(_run_shared_writer, shm.name, len(payload), writer, target))
+            for future in futures:
+                future.result()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Convert OWL to LinkML and Obsidian vault")
     src_group = parser.add_mutually_exclusive_group(required=True)
@@ -79,6 +152,11 @@ def main(argv: list[str] | None = None) -> None:
         action="store_true",
         help="Create missing output directories before writing results",
     )
+    parser.add_argument(
+        "--parallel-writers",
+        action="store_true",
+        help="Run the selected output writers concurrently in worker processes",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -97,27 +175,19 @@ def main(argv: list[str] | None = None) -> None:
         target_name = Path(urlparse(args.url).path).name or "ontology.owl"
         target_path = Path(temp_dir.name) / target_name
         log.info("Downloading OWL from %s", args.url)
-        urllib.request.urlretrieve(args.url, target_path)
+        _download(args.url, target_path)
         owl_path = str(target_path)
 
     log.info("Loading OWL model from %s", owl_path)
     model = load_owl(owl_path)
 
-    if args.linkml:
-        log.info("Writing LinkML YAML to %s", args.linkml)
-        write_linkml_yaml(model, args.linkml)
-    if args.vault:
-        log.info("Writing Obsidian vault to %s", args.vault)
-        write_obsidian_vault(model, args.vault)
-    if args.mkdocs:
-        log.info("Writing MkDocs documentation to %s", args.mkdocs)
-        write_mkdocs_docs(model, args.mkdocs)
-    if args.docsify:
-        log.info("Writing Docsify documentation to %s", args.docsify)
-        write_docsify_docs(model, args.docsify)
-    if args.hugo:
-        log.info("Writing Hugo site to %s", args.hugo)
-        write_hugo_site(model, args.hugo)
+    tasks = _writer_tasks(args)
+    if args.parallel_writers and len(tasks) > 1:
+        _run_writers_parallel(model, tasks)
+    else:
+        for message, writer, target in tasks:
+            log.info(message, target)
+            writer(model, target)
 
     if temp_dir:
         temp_dir.cleanup()
@@ -0,0 +1,51 @@
+"""Compact IRIs to CURIEs against a model's prefix map."""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (base length, {base: prefix}) buckets, longest bases first.
+PrefixIndex = Sequence[Tuple[int, Dict[str, str]]]
+
+
+def prefix_index(prefixes: Dict[str, str]) -> List[Tuple[int, Dict[str, str]]]:
+    """Group prefix bases by length so a lookup is one slice and hash per distinct length.
+
+    The first bucket holding an IRI's leading slice is its longest match; among
+    identical bases the earlier prefix in ``prefixes`` wins. Empty bases never match.
+    """
+
+    buckets: Dict[int, Dict[str, str]] = {}
+    for prefix, base in prefixes.items():
+        if base:
+            buckets.setdefault(len(base), {}).setdefault(base, prefix)
+    return sorted(buckets.items(), reverse=True)
+
+
+def to_qname(iri: str, index: PrefixIndex) -> Optional[str]:
+    """Return ``prefix:local`` for ``iri`` using an index from :func:`prefix_index`."""
+
+    size = len(iri)
+    for length, bases in index:
+        if length <= size:
+            prefix = bases.get(iri[:length])
+            if prefix is not None:
+                return f"{prefix}:{iri[length:]}"
+    return None
+
+
+class CurieMap(Dict[str, Optional[str]]):
+    """IRI -> CURIE (or ``None``) mapping that compacts each IRI on first lookup.
+
+    Renderers build one per run so repeated mentions of an IRI cost a dict hit.
+    """
+
+    def __init__(self, prefixes: Dict[str, str]) -> None:
+        super().__init__()
+        self.index = prefix_index(prefixes)
+
+    def __missing__(self, iri: str) -> Optional[str]:
+        curie = self[iri] = to_qname(iri, self.index)
+        return curie
+
+
+__all__ = ["CurieMap", "PrefixIndex", "prefix_index", "to_qname"]
@@ -3,58 +3,60 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
+from .file_writer import FileWriter
 from .mkdocs_writer import _write_markdown_docs
 from .model import OModel
 
 log = logging.getLogger(__name__)
 
+_INDEX_HTML_TEMPLATE = (
+    b"<!doctype html>\n"
+    b"<html>\n"
+    b"<head>\n"
+    b"  <meta charset=\"utf-8\" />\n"
+    b"  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n"
+    b"  <title>%b</title>\n"
+    b"  <link rel=\"stylesheet\" href=\"https://cdn.jsdelivr.net/npm/docsify@4/themes/vue.css\" />\n"
+    b"</head>\n"
+    b"<body>\n"
+    b"  <div id=\"app\"></div>\n"
+    b"  <script>\n"
+    b"    window.$docsify = {\n"
+    b"      name: '%b',\n"
+    b"      loadSidebar: true,\n"
+    b"    };\n"
+    b"  </script>\n"
+    b"  <script src=\"https://cdn.jsdelivr.net/npm/docsify@4\"></script>\n"
+    b"</body>\n"
+    b"</html>\n"
+)
 
-def _write_sidebar(nav: List[object], docs_dir: Path) -> None:
-    lines: List[str] = []
+
+def _sidebar_lines(nav: List[object]) -> Iterator[str]:
     for entry in nav:
         if not isinstance(entry, dict):
             continue
         for label, value in entry.items():
             if isinstance(value, list):
-                lines.append(f"- {label}")
+                yield f"- {label}"
                 for item in value:
                     if not isinstance(item, dict):
                         continue
                     for item_label, item_path in item.items():
-                        lines.append(f"  - [{item_label}]({item_path})")
+                        yield f"  - [{item_label}]({item_path})"
             else:
-                lines.append(f"- [{label}]({value})")
-    (docs_dir / "_sidebar.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-
-def _write_index_html(out_dir: Path, site_name: str) -> None:
-    content = "\n".join(
-        [
-            "<!doctype html>",
-            "<html>",
-            "<head>",
-            "  <meta charset=\"utf-8\" />",
-            "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />",
-            f"  <title>{site_name}</title>",
-            "  <link rel=\"stylesheet\" href=\"https://cdn.jsdelivr.net/npm/docsify@4/themes/vue.css\" />",
-            "</head>",
-            "<body>",
-            "  <div id=\"app\"></div>",
-            "  <script>",
-            "    window.$docsify = {",
-            f"      name: '{site_name}',",
-            "      loadSidebar: true,",
-            "    };",
-            "  </script>",
-            "  <script src=\"https://cdn.jsdelivr.net/npm/docsify@4\"></script>",
-            "</body>",
-            "</html>",
-            "",
-        ]
-    )
-    (out_dir / "index.html").write_text(content, encoding="utf-8")
+                yield f"- [{label}]({value})"
+
+
+def _write_sidebar(nav: List[object], docs_dir: Path, writer: FileWriter) -> None:
+    writer.submit(docs_dir / "_sidebar.md", "\n".join(_sidebar_lines(nav)) + "\n")
+
+
+def _write_index_html(out_dir: Path, site_name: str, writer: FileWriter) -> None:
+    name = site_name.encode("utf-8")
+    writer.submit(out_dir / "index.html", _INDEX_HTML_TEMPLATE % (name, name))
 
 
 def write_docsify_docs(om: OModel, out_dir: str) -> None:
@@ -73,9 +75,10 @@ def write_docsify_docs(om: OModel, out_dir: str) -> None:
         len(om.individuals),
     )
 
-    nav = _write_markdown_docs(om, docs_dir, index_filename="README.md")
-    _write_sidebar(nav, docs_dir)
-    _write_index_html(base, om.ontology_iri or "owl2vault docs")
+    with FileWriter() as writer:
+        nav = _write_markdown_docs(om, docs_dir, index_filename="README.md", writer=writer)
+        _write_sidebar(nav, docs_dir, writer)
+        _write_index_html(base, om.ontology_iri or "owl2vault docs", writer)
 
 
 __all__ = ["write_docsify_docs"]
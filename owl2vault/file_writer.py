@@ -0,0 +1,106 @@
+"""Background file writer shared by the static-site generators."""
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+# File writes release the GIL, so a handful of threads keeps the disk busy
+# while the caller renders.
+_DEFAULT_WORKERS = 4
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+class FileWriter:
+    """Write files from a few background threads.
+
+    Callers queue ``(path, content)`` pairs with :meth:`submit` and keep
+    rendering; :meth:`flush` waits until everything queued so far is on disk and
+    :meth:`close` stops the threads. Each path is always handled by the same
+    thread, so repeated writes to one file land in submission order. The first
+    write error is re-raised from ``flush``/``close``.
+    """
+
+    def __init__(self, workers: int = _DEFAULT_WORKERS) -> None:
+        self._queues: List["queue.Queue[Optional[Tuple[str, bytes]]]"] = [
+            queue.Queue() for _ in range(max(1, workers))
+        ]
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._drain, args=(q,), name=f"owl2vault-file-writer-{i}", daemon=True)
+            for i, q in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _drain(self, items: "queue.Queue[Optional[Tuple[str, bytes]]]") -> None:
+        while True:
+            item = items.get()
+            try:
+                if item is None:
+                    return
+                if self._error is None:
+                    _write_bytes(*item)
+            except BaseException as exc:
+                log.error("Failed to write %s: %s", item[0] if item else "<unknown>", exc)
+                with self._error_lock:
+                    if self._error is None:
+                        self._error = exc
+            finally:
+                items.task_done()
+
+    def submit(self, path: Union[str, Path], content: Union[str, bytes]) -> None:
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        path = os.fspath(path)
+        self._queues[hash(path) % len(self._queues)].put((path, data))
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self) -> None:
+        for items in self._queues:
+            items.join()
+        self._raise_pending()
+
+    def close(self) -> None:
+        live = [(items, thread) for items, thread in zip(self._queues, self._threads) if thread.is_alive()]
+        for items, _ in live:
+            items.put(None)
+        for _, thread in live:
+            thread.join()
+        self._raise_pending()
+
+    def __enter__(self) -> "FileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self.close()
+        except Exception:  # pragma: no cover - keep the original exception
+            pass
+
+
+__all__ = ["FileWriter"]
@@ -4,124 +4,130 @@ from __future__ import annotations
 import logging
 import os
 import re
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Tuple
 
+from .file_writer import FileWriter
 from .mkdocs_writer import _write_markdown_docs
 from .model import OModel
 
 log = logging.getLogger(__name__)
 
+_CONFIG_TEMPLATE = b'title = "%b"\nbaseURL = "/"\nlanguageCode = "en-us"\n'
+_TOML_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+_FRONT_MATTER_TEMPLATE = '+++\ntitle = "{title}"\ntype = "default"\n+++\n'
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 
-def _write_config(out_dir: Path, site_name: str) -> None:
-    content = "\n".join(
-        [
-            f'title = "{site_name}"',
-            'baseURL = "/"',
-            'languageCode = "en-us"',
-            "",
-        ]
-    )
-    (out_dir / "hugo.toml").write_text(content, encoding="utf-8")
+
+def _write_config(out_dir: Path, site_name: str, writer: FileWriter) -> None:
+    writer.submit(out_dir / "hugo.toml", _CONFIG_TEMPLATE % site_name.encode("utf-8"))
 
 
 def _toml_escape(text: str) -> str:
-    return text.replace("\\", "\\\\").replace("\"", "\\\"")
+    return text.translate(_TOML_ESCAPES)
 
 
-def _write_section_indexes(nav: List[object], content_dir: Path) -> None:
-    for entry in nav:
-        if not isinstance(entry, dict):
-            continue
-        for section, items in entry.items():
-            if not isinstance(items, list):
-                continue
-            first_path = None
-            for item in items:
-                if isinstance(item, dict):
-                    first_path = next(iter(item.values()), None)
-                    if first_path:
-                        break
-            if not first_path:
-                continue
-            section_dir = content_dir / Path(first_path).parent
-            lines = [
-                "+++",
-                f'title = "{_toml_escape(section)}"',
-                'type = "chapter"',
-                "+++",
-                "",
-            ]
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                for label, path in item.items():
-                    rel = Path(path).as_posix()
-                    lines.append(f"- [{label}]({{{{% relref \"{rel}\" %}}}})")
-            (section_dir / "_index.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-
-def _add_front_matter(content_dir: Path) -> None:
-    for md in content_dir.rglob("*.md"):
-        if md.name == "_index.md":
-            continue
-        text = md.read_text(encoding="utf-8")
-        if text.lstrip().startswith("+++"):
+def _nav_sections(nav: List[object]) -> List[Tuple[str, List[Tuple[str, str]]]]:
+    return [
+        (section, [(label, path) for item in items if isinstance(item, dict) for label, path in item.items()])
+        for entry in nav
+        if isinstance(entry, dict)
+        for section, items in entry.items()
+        if isinstance(items, list)
+    ]
+
+
+def _write_section_indexes(nav: List[object], content_dir: Path, writer: FileWriter) -> None:
+    content_root = str(content_dir)
+    for section, pages in _nav_sections(nav):
+        first_path = next((path for _, path in pages if path), None)
+        if not first_path:
             continue
-        title = md.stem
-        lines = text.splitlines()
-        body_lines: List[str] = []
-        heading_consumed = False
-        for line in lines:
-            if not heading_consumed and line.startswith("# "):
-                title = line[2:].strip()
-                heading_consumed = True
-                continue
-            body_lines.append(line)
-        front = "\n".join(
-            [
-                "+++",
-                f'title = "{_toml_escape(title)}"',
-                'type = "default"',
-                "+++",
-                "",
-            ]
-        )
-        md.write_text(front + "\n".join(body_lines).lstrip(), encoding="utf-8")
-
-
-def _rewrite_links_for_hugo(content_dir: Path) -> None:
-    link_re = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-    for md in content_dir.rglob("*.md"):
-        text = md.read_text(encoding="utf-8")
-
-        def _replace(match: re.Match[str]) -> str:
-            label = match.group(1)
-            target = match.group(2).strip()
-            if target.startswith(("http://", "https://", "mailto:")):
-                return match.group(0)
-            if target.startswith("#"):
-                return match.group(0)
-            target, anchor = (target.split("#", 1) + [""])[:2]
-            target = target.split("?", 1)[0]
-            if not target.endswith(".md"):
-                return match.group(0)
-            resolved = (md.parent / target).resolve()
-            try:
-                rel = resolved.relative_to(content_dir)
-            except ValueError:
-                rel = Path(os.path.relpath(resolved, content_dir))
-            rel_str = rel.as_posix()
-            if not rel_str.endswith(".md"):
-                return match.group(0)
-            repl = "[{}]({{{{% relref \"{}\" %}}}})".format(label, rel_str)
-            if anchor:
-                repl += f"#{anchor}"
-            return repl
-
-        updated = link_re.sub(_replace, text)
+        # Nav paths are generated POSIX fragments such as "classes/<id>.md".
+        section_dir = os.path.join(content_root, first_path.rpartition("/")[0])
+        header = f'+++\ntitle = "{_toml_escape(section)}"\ntype = "chapter"\n+++\n\n'
+        links = "".join([f"- [{label}]({{{{% relref \"{path}\" %}}}})\n" for label, path in pages])
+        writer.submit(os.path.join(section_dir, "_index.md"), header + links)
+
+
+def _walk_markdown(root: str) -> Iterator[str]:
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_markdown(entry.path)
+            elif entry.name.endswith(".md"):
+                yield entry.path
+
+
+def _with_front_matter(text: str, default_title: str) -> str:
+    if text.lstrip().startswith("+++"):
+        return text
+    title = default_title
+    body = text
+    if text.startswith("# "):
+        heading_start = 0
+    else:
+        heading_start = text.find("\n# ")
+        if heading_start >= 0:
+            heading_start += 1
+    if heading_start >= 0:
+        heading_end = text.find("\n", heading_start)
+        if heading_end < 0:
+            heading_end = len(text)
+        title = text[heading_start + 2 : heading_end].strip()
+        body = text[:heading_start] + text[heading_end + 1 :]
+    if body.endswith("\n"):
+        body = body[:-1]
+    return _FRONT_MATTER_TEMPLATE.format(title=_toml_escape(title)) + body.lstrip()
+
+
+def _relative_target(md_dir: str, target: str, content_root: str, cache: Dict[Tuple[str, str], str]) -> str:
+    key = (md_dir, target)
+    rel_str = cache.get(key)
+    if rel_str is None:
+        # Generated content has no symlinks, so a lexical normpath matches resolve().
+        resolved = os.path.normpath(os.path.join(md_dir, target))
+        rel_str = Path(os.path.relpath(resolved, content_root)).as_posix()
+        cache[key] = rel_str
+    return rel_str
+
+
+def _hugo_link(match: re.Match[str], md_dir: str, content_root: str, cache: Dict[Tuple[str, str], str]) -> str:
+    label = match.group(1)
+    target = match.group(2).strip()
+    if target.startswith(("http://", "https://", "mailto:")):
+        return match.group(0)
+    if target.startswith("#"):
+        return match.group(0)
+    target, anchor = (target.split("#", 1) + [""])[:2]
+    target = target.split("?", 1)[0]
+    if not target.endswith(".md"):
+        return match.group(0)
+    rel_str = _relative_target(md_dir, target, content_root, cache)
+    if not rel_str.endswith(".md"):
+        return match.group(0)
+    repl = "[{}]({{{{% relref \"{}\" %}}}})".format(label, rel_str)
+    if anchor:
+        repl += f"#{anchor}"
+    return repl
+
+
+def _postprocess_content(content_dir: Path, writer: FileWriter) -> None:
+    """Add front matter and rewrite links to relref in a single pass per file."""
+
+    content_root = str(content_dir)
+    rel_cache: Dict[Tuple[str, str], str] = {}
+    for md_path in _walk_markdown(content_root):
+        md_dir, md_name = os.path.split(md_path)
+        text = Path(md_path).read_bytes().decode("utf-8")
+        updated = text
+        if md_name != "_index.md":
+            updated = _with_front_matter(updated, md_name[: -len(".md")])
+        if "](" in updated:
+            updated = _LINK_RE.sub(partial(_hugo_link, md_dir=md_dir, content_root=content_root, cache=rel_cache), updated)
         if updated != text:
-            md.write_text(updated, encoding="utf-8")
+            writer.submit(md_path, updated)
 
 
 def write_hugo_site(om: OModel, out_dir: str) -> None:
@@ -140,11 +146,13 @@ def write_hugo_site(om: OModel, out_dir: str) -> None:
         len(om.individuals),
     )
 
-    nav = _write_markdown_docs(om, content_dir, index_filename="_index.md")
-    _write_section_indexes(nav, content_dir)
-    _add_front_matter(content_dir)
-    _rewrite_links_for_hugo(content_dir)
-    _write_config(base, om.ontology_iri or "owl2vault docs")
+    with FileWriter() as writer:
+        nav = _write_markdown_docs(om, content_dir, index_filename="_index.md", writer=writer)
+        _write_section_indexes(nav, content_dir, writer)
+        # Post-processing reads the generated pages back, so they must be on disk first.
+        writer.flush()
+        _postprocess_content(content_dir, writer)
+        _write_config(base, om.ontology_iri or "owl2vault docs", writer)
 
 
 __all__ = ["write_hugo_site"]
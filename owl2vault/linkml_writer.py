@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict
+import textwrap
+from typing import Callable, Dict, Iterator, Optional, Set, TextIO, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeDumper as _YamlDumper
+
 from .model import OModel, OSlot
 
 
 log = logging.getLogger(__name__)
 
+_WRITE_BUFFER_SIZE = 1 << 20
+_YAML_WIDTH = 80
+_SECTION_INDENT = "  "
+
 
 _LINKML_DATATYPES = {
     "http://www.w3.org/2001/XMLSchema#string": "string",
@@ -21,47 +31,53 @@ _LINKML_DATATYPES = {
 }
 
 
-def _slot_entry(slot: OSlot, om: OModel) -> Dict:
-    range_label = _range_for_slot(slot, om)
+def _build_slot_entry(
+    description: Optional[str], range_label: str, min_card: Optional[int], max_card: Optional[int]
+) -> Dict:
     entry: Dict[str, object] = {
-        "description": slot.description,
+        "description": description,
         "range": range_label,
-        "required": slot.min_card is not None and slot.min_card >= 1,
-        "multivalued": slot.max_card is None or slot.max_card > 1,
+        "required": min_card is not None and min_card >= 1,
+        "multivalued": max_card is None or max_card > 1,
     }
-    if slot.min_card is not None:
-        entry["minimum_cardinality"] = slot.min_card
-    if slot.max_card is not None:
-        entry["maximum_cardinality"] = slot.max_card
+    if min_card is not None:
+        entry["minimum_cardinality"] = min_card
+    if max_card is not None:
+        entry["maximum_cardinality"] = max_card
     return entry
 
 
-def _range_for_slot(slot: OSlot, om: OModel) -> str:
-    if slot.range_iri in om.classes:
-        return om.classes[slot.range_iri].label
-    if slot.range_iri in om.enums:
-        return om.enums[slot.range_iri].label
-    if slot.range_iri in om.datatypes:
-        return om.datatypes[slot.range_iri].label
-    return slot.range_label
+def _slot_entry(slot: OSlot, range_labels: Dict[str, str]) -> Dict:
+    return _build_slot_entry(slot.description, _range_for_slot(slot, range_labels), slot.min_card, slot.max_card)
 
 
-def model_to_linkml(om: OModel) -> Dict:
-    """Convert the model to a LinkML schema dictionary."""
+def _range_labels(om: OModel) -> Dict[str, str]:
+    """Map class, enum and datatype IRIs to labels (classes win, then enums)."""
+
+    labels = {iri: dt.label for iri, dt in om.datatypes.items()}
+    labels.update({iri: enum.label for iri, enum in om.enums.items()})
+    labels.update({iri: cls.label for iri, cls in om.classes.items()})
+    return labels
+
 
-    schema: Dict[str, object] = {
+def _range_for_slot(slot: OSlot, range_labels: Dict[str, str]) -> str:
+    return range_labels.get(slot.range_iri, slot.range_label)
+
+
+def _schema_header(om: OModel) -> Dict[str, object]:
+    return {
         "id": om.ontology_iri or "urn:generated:owl2vault",
         "name": "owl2vault_schema",
         "prefixes": om.prefixes,
         "default_prefix": next(iter(om.prefixes.keys()), "owl2vault"),
         "imports": ["linkml:types"],
-        "types": {},
-        "enums": {},
-        "slots": {},
-        "classes": {},
     }
 
-    for dt in om.datatypes.values():
+
+def _type_entries(om: OModel) -> Iterator[Tuple[str, Dict[str, object]]]:
+    # Keyed by label: a later duplicate replaces the value but keeps the first position.
+    by_label = {dt.label: dt for dt in om.datatypes.values()}
+    for label, dt in by_label.items():
         base = _LINKML_DATATYPES.get(dt.iri, dt.label)
         dt_entry: Dict[str, object] = {
             "uri": dt.iri,
@@ -70,47 +86,44 @@ def model_to_linkml(om: OModel) -> Dict:
         }
         if dt.pattern:
             dt_entry["pattern"] = dt.pattern
-        schema["types"][dt.label] = dt_entry
+        yield label, dt_entry
 
-    for enum in om.enums.values():
-        enum_entry: Dict[str, object] = {
-            "description": enum.description,
-            "permissible_values": {},
-        }
+
+def _enum_entries(om: OModel) -> Iterator[Tuple[str, Dict[str, object]]]:
+    by_label = {enum.label: enum for enum in om.enums.values()}
+    for label, enum in by_label.items():
+        permissible_values: Dict[str, object] = {}
         for val in enum.values:
-            enum_entry["permissible_values"][val.code] = {
+            permissible_values[val.code] = {
                 "text": val.label or val.code,
                 "description": val.description,
             }
-        schema["enums"][enum.label] = enum_entry
+        yield label, {"description": enum.description, "permissible_values": permissible_values}
+
 
-    slots: Dict[str, Dict[str, object]] = {}
+def _slot_entries(om: OModel) -> Iterator[Tuple[str, Dict[str, object]]]:
+    range_labels = _range_labels(om)
+    seen: Set[str] = set()
     for prop in om.properties.values():
+        if prop.label in seen:
+            continue
+        seen.add(prop.label)
         range_iri = prop.ranges[0] if prop.ranges else "http://www.w3.org/2002/07/owl#Thing"
-        if range_iri in om.classes:
-            range_label = om.classes[range_iri].label
-        elif range_iri in om.enums:
-            range_label = om.enums[range_iri].label
-        elif range_iri in om.datatypes:
-            range_label = om.datatypes[range_iri].label
-        else:
-            range_label = prop.label
-        slot_like = OSlot(
-            iri=prop.iri,
-            name=prop.label,
-            description=prop.description,
-            range_iri=range_iri,
-            range_label=range_label,
-            is_object=prop.kind == "object",
-        )
-        slots.setdefault(slot_like.name, _slot_entry(slot_like, om))
+        range_label = range_labels.get(range_iri, prop.label)
+        yield prop.label, _build_slot_entry(prop.description, range_label, None, None)
 
     for cls in om.classes.values():
         for slot in cls.slots:
-            slots.setdefault(slot.name, _slot_entry(slot, om))
-    schema["slots"].update(slots)
+            # Slots are shared across classes; only the first entry per name is kept.
+            if slot.name in seen:
+                continue
+            seen.add(slot.name)
+            yield slot.name, _slot_entry(slot, range_labels)
 
-    for cls in om.classes.values():
+
+def _class_entries(om: OModel) -> Iterator[Tuple[str, Dict[str, object]]]:
+    by_label = {cls.label: cls for cls in om.classes.values()}
+    for label, cls in by_label.items():
         cls_entry: Dict[str, object] = {
             "description": cls.description,
             "slots": [slot.name for slot in cls.slots],
@@ -119,18 +132,52 @@ def model_to_linkml(om: OModel) -> Dict:
             super_iri = cls.super_iris[0]
             if super_iri in om.classes:
                 cls_entry["is_a"] = om.classes[super_iri].label
-        schema["classes"][cls.label] = cls_entry
+        yield label, cls_entry
+
+
+_SECTIONS: Tuple[Tuple[str, Callable[[OModel], Iterator[Tuple[str, Dict[str, object]]]]], ...] = (
+    ("types", _type_entries),
+    ("enums", _enum_entries),
+    ("slots", _slot_entries),
+    ("classes", _class_entries),
+)
+
+
+def model_to_linkml(om: OModel) -> Dict:
+    """Convert the model to a LinkML schema dictionary."""
 
+    schema = _schema_header(om)
+    for section, entries in _SECTIONS:
+        schema[section] = dict(entries(om))
     return schema
 
 
+def _dump_yaml(data: object, stream: Optional[TextIO] = None, width: int = _YAML_WIDTH) -> Optional[str]:
+    return yaml.dump(data, stream, Dumper=_YamlDumper, sort_keys=False, default_flow_style=False, width=width)
+
+
+def _write_section(fh: TextIO, section: str, entries: Iterator[Tuple[str, Dict[str, object]]]) -> None:
+    empty = True
+    for label, entry in entries:
+        if empty:
+            fh.write(f"{section}:\n")
+            empty = False
+        # Dump each entry on its own and shift it under the section key; the width
+        # is reduced by the indent so long scalars wrap where a full dump would.
+        block = _dump_yaml({label: entry}, width=_YAML_WIDTH - len(_SECTION_INDENT))
+        fh.write(textwrap.indent(block, _SECTION_INDENT))
+    if empty:
+        _dump_yaml({section: {}}, fh)
+
+
 def write_linkml_yaml(om: OModel, path: str) -> None:
-    """Serialize the LinkML schema to YAML."""
+    """Serialize the LinkML schema to YAML, one section entry at a time."""
 
-    data = model_to_linkml(om)
     log.info("Writing LinkML schema with %d classes to %s", len(om.classes), path)
-    with open(path, "w", encoding="utf-8") as fh:
-        yaml.safe_dump(data, fh, sort_keys=False)
+    with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fh:
+        _dump_yaml(_schema_header(om), fh)
+        for section, entries in _SECTIONS:
+            _write_section(fh, section, entries(om))
 
 
 __all__ = ["model_to_linkml", "write_linkml_yaml"]
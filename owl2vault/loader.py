@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional, Set
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from rdflib import BNode, Graph, Literal, URIRef
-from rdflib.collection import Collection
+from rdflib.term import Node
 from rdflib.util import guess_format
 from rdflib.namespace import OWL, RDF, RDFS, XSD
 
@@ -33,6 +35,88 @@ _XSD_TYPE_INFO: Dict[str, tuple[str, str]] = {
 }
 
 
+# Predicates whose reverse (object -> subjects) lookup the loader needs.
+_REVERSE_PREDICATES = (RDF.type, OWL.inverseOf)
+
+# The loader reads a single default graph, so skip the context bookkeeping of
+# rdflib's default store; parsing into SimpleMemory is noticeably cheaper.
+_GRAPH_STORE = "SimpleMemory"
+
+_CODE_RE = re.compile(r"[^A-Za-z0-9_]+")
+
+# Leading bytes inspected to tell RDF/XML from Turtle before parsing; large
+# enough to get past a licence header.
+_SNIFF_BYTES = 8192
+_XML_MARKERS = ("<?xml", "<rdf:RDF", "<!DOCTYPE")
+_XML_HINT_RE = re.compile(r"<rdf:RDF\b|\bxmlns:")
+_TURTLE_DIRECTIVE_RE = re.compile(r"^\s*(?:@prefix|@base|PREFIX|BASE)\b", re.MULTILINE)
+# Whitespace, ``#`` comment lines and ``<!-- -->`` blocks ahead of the first statement.
+_LEADING_COMMENTS_RE = re.compile(r"(?:\s+|#[^\n]*|<!--.*?(?:-->|\Z))*", re.DOTALL)
+_FALLBACK_FORMAT = {"xml": "turtle", "turtle": "xml"}
+
+
+@dataclass
+class _GraphIndex:
+    """Subject-keyed view of a graph plus reverse lookups, built in one pass."""
+
+    spo: Dict[Node, Dict[Node, List[Node]]] = field(default_factory=dict)
+    pos: Dict[Node, Dict[Node, List[Node]]] = field(default_factory=dict)
+    int_values: Dict[Node, Optional[int]] = field(default_factory=dict)
+    one_of: Dict[Node, Node] = field(default_factory=dict)
+    labels: Dict[Node, str] = field(default_factory=dict)
+
+    def objects(self, subject: Node, predicate: Node) -> Sequence[Node]:
+        return self.spo.get(subject, {}).get(predicate, ())
+
+    def value(self, subject: Node, predicate: Node) -> Optional[Node]:
+        objects = self.objects(subject, predicate)
+        return objects[0] if objects else None
+
+    def subjects(self, predicate: Node, obj: Node) -> Sequence[Node]:
+        return self.pos.get(predicate, {}).get(obj, ())
+
+    def has_type(self, subject: Node, type_node: Node) -> bool:
+        return type_node in self.objects(subject, RDF.type)
+
+    def int_value(self, node: Optional[Node]) -> Optional[int]:
+        """Integer value of a literal, converted once per distinct literal."""
+
+        if node is None:
+            return None
+        if node not in self.int_values:
+            self.int_values[node] = _int_or_none(node)
+        return self.int_values[node]
+
+
+def _index_graph(graph: Graph) -> _GraphIndex:
+    # SimpleMemory yields an unpatterned scan straight from its subject index, so one
+    # pass groups every edge by subject while keeping per-subject object order.
+    index = _GraphIndex()
+    spo = index.spo
+    current: Optional[Node] = None
+    by_predicate: Dict[Node, List[Node]] = {}
+    for subject, predicate, obj in graph:
+        if subject is not current:
+            current = subject
+            by_predicate = spo.get(subject)
+            if by_predicate is None:
+                by_predicate = spo[subject] = {}
+        objects = by_predicate.get(predicate)
+        if objects is None:
+            by_predicate[predicate] = [obj]
+        else:
+            objects.append(obj)
+    index.one_of = {
+        subject: by_predicate[OWL.oneOf][0] for subject, by_predicate in spo.items() if OWL.oneOf in by_predicate
+    }
+    for predicate in _REVERSE_PREDICATES:
+        reverse: Dict[Node, List[Node]] = {}
+        for subject, _, obj in graph.triples((None, predicate, None)):
+            reverse.setdefault(obj, []).append(subject)
+        index.pos[predicate] = reverse
+    return index
+
+
 def _local_name(iri: URIRef) -> str:
     text = str(iri)
     for sep in ["#", "/"]:
@@ -41,8 +125,22 @@ def _local_name(iri: URIRef) -> str:
     return text or str(iri)
 
 
-def _label_for(graph: Graph, node) -> str:
-    labels = list(graph.objects(node, RDFS.label))
+def _iri_strings(nodes: Iterable[Node]) -> List[str]:
+    """String forms of the IRI objects in ``nodes``; literals and blank nodes are dropped."""
+
+    return [str(node) for node in nodes if isinstance(node, URIRef)]
+
+
+def _label_for(index: _GraphIndex, node) -> str:
+    # Labels are looked up repeatedly (ranges, enum members, individuals); resolve once.
+    label = index.labels.get(node)
+    if label is None:
+        label = index.labels[node] = _resolve_label(index, node)
+    return label
+
+
+def _resolve_label(index: _GraphIndex, node) -> str:
+    labels = index.objects(node, RDFS.label)
     if labels:
         # Prefer English labels if present
         for l in labels:
@@ -54,28 +152,33 @@ def _label_for(graph: Graph, node) -> str:
     return str(node)
 
 
-def _comment(graph: Graph, node) -> Optional[str]:
-    comment = graph.value(node, RDFS.comment)
+def _comment(index: _GraphIndex, node) -> Optional[str]:
+    comment = index.value(node, RDFS.comment)
     return str(comment) if comment else None
 
 
-def _collect_annotations(graph: Graph, model: OModel, subject: URIRef) -> Dict[str, list[tuple[str, bool]]]:
+_SKIPPED_ANNOTATION_IRIS = frozenset({str(RDFS.label), str(RDFS.comment)})
+
+
+def _annotation_property_iris(index: _GraphIndex) -> Set[str]:
+    """IRIs of every declared annotation property, computed once per load."""
+
+    return {
+        str(prop)
+        for prop in index.subjects(RDF.type, OWL.AnnotationProperty)
+        if isinstance(prop, URIRef)
+    } - _SKIPPED_ANNOTATION_IRIS
+
+
+def _collect_annotations(
+    index: _GraphIndex, annotation_iris: Set[str], subject: URIRef
+) -> Dict[str, list[tuple[str, bool]]]:
     annotations: Dict[str, list[tuple[str, bool]]] = {}
-    for pred, obj in graph.predicate_objects(subject):
-        if not isinstance(pred, URIRef):
-            continue
+    for pred, objects in index.spo.get(subject, {}).items():
         pred_iri = str(pred)
-        if pred_iri in (str(RDFS.label), str(RDFS.comment)):
+        if pred_iri not in annotation_iris:
             continue
-        is_annotation = (
-            (pred, RDF.type, OWL.AnnotationProperty) in graph
-            or pred_iri in model.properties and model.properties[pred_iri].is_annotation
-        )
-        if not is_annotation:
-            continue
-        is_iri = isinstance(obj, URIRef)
-        val = str(obj)
-        annotations.setdefault(pred_iri, []).append((val, is_iri))
+        annotations[pred_iri] = [(str(obj), isinstance(obj, URIRef)) for obj in objects]
     return annotations
 
 
@@ -89,75 +192,86 @@ def _int_or_none(value: Optional[Literal]) -> Optional[int]:
 
 
 def _sanitize_code(text: str) -> str:
-    import re
-
-    return re.sub(r"[^A-Za-z0-9_]+", "_", text).strip("_") or "value"
-
-
-def _extract_enum(graph: Graph, cls: URIRef, one_of) -> OEnumeration:
-    enum_label = _label_for(graph, cls)
-    desc = _comment(graph, cls)
+    # ASCII identifiers without edge underscores are already valid codes.
+    if text.isascii() and text.isidentifier() and text[0] != "_" and text[-1] != "_":
+        return text
+    return _CODE_RE.sub("_", text).strip("_") or "value"
+
+
+def _iter_rdf_list(index: _GraphIndex, head: Node) -> Iterator[Node]:
+    """Yield the members of an rdf:List by following rdf:first/rdf:rest in the index."""
+
+    seen: Set[Node] = set()
+    node: Optional[Node] = head
+    while node is not None and node != RDF.nil:
+        if node in seen:
+            raise ValueError("List contains a recursive rdf:rest reference")
+        seen.add(node)
+        facts = index.spo.get(node, {})
+        first = facts.get(RDF.first)
+        if first:
+            yield first[0]
+        rest = facts.get(RDF.rest)
+        node = rest[0] if rest else None
+
+
+def _extract_enum(index: _GraphIndex, cls: URIRef, one_of) -> OEnumeration:
+    enum_label = _label_for(index, cls)
+    desc = _comment(index, cls)
     values = []
-    members = Collection(graph, one_of) if isinstance(one_of, BNode) else []
+    members = _iter_rdf_list(index, one_of) if isinstance(one_of, BNode) else ()
     for member in members:
-        member_label = _label_for(graph, member)
+        member_label = _label_for(index, member)
         code = _sanitize_code(member_label or _local_name(member))
         values.append(
             OEnumValue(
                 iri=str(member),
                 code=code,
                 label=member_label,
-                description=_comment(graph, member),
+                description=_comment(index, member),
             )
         )
     return OEnumeration(iri=str(cls), label=enum_label, description=desc, values=values)
 
 
-def _ensure_datatype(model: OModel, iri: str) -> None:
-    if iri in model.datatypes:
-        return
-    if iri in _XSD_TYPE_INFO:
-        label, base = _XSD_TYPE_INFO[iri]
-        model.datatypes[iri] = ODatatype(iri=iri, label=label, base_iri=base, description=None)
-
-
-def _range_label(model: OModel, graph: Graph, node) -> str:
+def _range_label(model: OModel, index: _GraphIndex, node) -> str:
     iri = str(node)
-    if iri in model.classes:
-        return model.classes[iri].label
-    if iri in model.enums:
-        return model.enums[iri].label
-    if iri in model.datatypes:
-        return model.datatypes[iri].label
-    return _label_for(graph, node)
+    for table in (model.classes, model.enums, model.datatypes):
+        entry = table.get(iri)
+        if entry is not None:
+            return entry.label
+    return _label_for(index, node)
 
 
-def _collect_properties(graph: Graph, model: OModel) -> None:
+def _collect_properties(index: _GraphIndex, model: OModel, annotation_iris: Set[str]) -> None:
     prop_kinds = [
         (OWL.ObjectProperty, "object"),
         (OWL.DatatypeProperty, "data"),
         (OWL.AnnotationProperty, "annotation"),
     ]
     for prop_type, kind in prop_kinds:
-        for prop in graph.subjects(RDF.type, prop_type):
+        for prop in index.subjects(RDF.type, prop_type):
             iri = str(prop)
-            label = _label_for(graph, prop)
-            desc = _comment(graph, prop)
-            domains = [str(d) for d in graph.objects(prop, RDFS.domain) if isinstance(d, URIRef)]
-            ranges = [str(r) for r in graph.objects(prop, RDFS.range) if isinstance(r, URIRef)]
-            for rng in ranges:
-                _ensure_datatype(model, rng)
-            inverses = {str(inv) for inv in graph.objects(prop, OWL.inverseOf) if isinstance(inv, URIRef)}
-            inverses.update({str(s) for s in graph.subjects(OWL.inverseOf, prop) if isinstance(s, URIRef)})
-            equivalents = [str(eq) for eq in graph.objects(prop, OWL.equivalentProperty) if isinstance(eq, URIRef)]
+            label = _label_for(index, prop)
+            desc = _comment(index, prop)
+            facts = index.spo.get(prop, {})
+            domains = _iri_strings(facts.get(RDFS.domain, ()))
+            ranges = _iri_strings(facts.get(RDFS.range, ()))
+            inverses = {
+                str(inv)
+                for inv in (*facts.get(OWL.inverseOf, ()), *index.subjects(OWL.inverseOf, prop))
+                if isinstance(inv, URIRef)
+            }
+            equivalents = _iri_strings(facts.get(OWL.equivalentProperty, ()))
+            prop_types = facts.get(RDF.type, ())
             characteristics: list[str] = []
-            if (prop, RDF.type, OWL.FunctionalProperty) in graph:
+            if OWL.FunctionalProperty in prop_types:
                 characteristics.append("functional")
-            if (prop, RDF.type, OWL.InverseFunctionalProperty) in graph:
+            if OWL.InverseFunctionalProperty in prop_types:
                 characteristics.append("inverse_functional")
-            if (prop, RDF.type, OWL.SymmetricProperty) in graph:
+            if OWL.SymmetricProperty in prop_types:
                 characteristics.append("symmetric")
-            if (prop, RDF.type, OWL.TransitiveProperty) in graph:
+            if OWL.TransitiveProperty in prop_types:
                 characteristics.append("transitive")
             model.properties[iri] = OProperty(
                 iri=iri,
@@ -168,52 +282,57 @@ def _collect_properties(graph: Graph, model: OModel) -> None:
                 kind=kind,
                 equivalent_iris=equivalents,
                 characteristics=characteristics,
-                inverse_iris=sorted(inverses),
-                annotations=_collect_annotations(graph, model, prop),
+                inverse_iris=sorted(inverses) if len(inverses) > 1 else list(inverses),
+                annotations=_collect_annotations(index, annotation_iris, prop),
             )
 
 
-def _is_object_property(graph: Graph, prop: URIRef) -> bool:
-    if (prop, RDF.type, OWL.ObjectProperty) in graph:
+def _is_object_property(index: _GraphIndex, prop: URIRef) -> bool:
+    if index.has_type(prop, OWL.ObjectProperty):
         return True
-    if (prop, RDF.type, OWL.DatatypeProperty) in graph:
+    if index.has_type(prop, OWL.DatatypeProperty):
         return False
     return True
 
 
-def _restriction_to_slot(model: OModel, graph: Graph, restriction: BNode) -> Optional[OSlot]:
-    if (restriction, RDF.type, OWL.Restriction) not in graph:
+def _restriction_to_slot(model: OModel, index: _GraphIndex, restriction: BNode) -> Optional[OSlot]:
+    facts = index.spo.get(restriction)
+    if not facts or OWL.Restriction not in facts.get(RDF.type, ()):
         return None
-    prop = graph.value(restriction, OWL.onProperty)
+
+    def _first(predicate: Node) -> Optional[Node]:
+        values = facts.get(predicate)
+        return values[0] if values else None
+
+    prop = _first(OWL.onProperty)
     if prop is None:
         return None
-    range_node = graph.value(restriction, OWL.allValuesFrom) or graph.value(restriction, OWL.someValuesFrom)
+    range_node = _first(OWL.allValuesFrom) or _first(OWL.someValuesFrom)
     if range_node is None:
         return None
 
-    min_card = _int_or_none(graph.value(restriction, OWL.minCardinality))
-    max_card = _int_or_none(graph.value(restriction, OWL.maxCardinality))
-    exact_card = _int_or_none(graph.value(restriction, OWL.cardinality))
+    min_card = index.int_value(_first(OWL.minCardinality))
+    max_card = index.int_value(_first(OWL.maxCardinality))
+    exact_card = index.int_value(_first(OWL.cardinality))
     if exact_card is not None:
         min_card = exact_card
         max_card = exact_card
 
     range_iri = str(range_node)
-    _ensure_datatype(model, range_iri)
-    is_obj = _is_object_property(graph, prop)
+    is_obj = _is_object_property(index, prop)
     return OSlot(
         iri=str(prop),
-        name=_label_for(graph, prop),
-        description=_comment(graph, prop),
+        name=_label_for(index, prop),
+        description=_comment(index, prop),
         range_iri=range_iri,
-        range_label=_range_label(model, graph, range_node),
+        range_label=_range_label(model, index, range_node),
         is_object=is_obj,
         min_card=min_card,
         max_card=max_card,
     )
 
 
-def _slot_from_property(model: OModel, graph: Graph, prop: OProperty) -> OSlot:
+def _slot_from_property(model: OModel, index: _GraphIndex, prop: OProperty) -> OSlot:
     if prop.ranges:
         range_iri = prop.ranges[0]
     elif prop.kind == "object":
@@ -222,142 +341,193 @@ def _slot_from_property(model: OModel, graph: Graph, prop: OProperty) -> OSlot:
         range_iri = str(XSD.string)
     else:
         range_iri = str(XSD.string)
-    _ensure_datatype(model, range_iri)
     return OSlot(
         iri=prop.iri,
         name=prop.label,
         description=prop.description,
         range_iri=range_iri,
-        range_label=_range_label(model, graph, URIRef(range_iri)),
+        range_label=_range_label(model, index, URIRef(range_iri)),
         is_object=prop.kind == "object",
         min_card=None,
         max_card=None,
     )
 
 
+def _sniff_format(head: str) -> Optional[str]:
+    """Return ``"xml"`` or ``"turtle"`` when the leading text settles it, else ``None``."""
+
+    body = head[_LEADING_COMMENTS_RE.match(head).end():]
+    if body.startswith(_XML_MARKERS):
+        return "xml"
+    if _TURTLE_DIRECTIVE_RE.search(head):
+        return "turtle"
+    if _XML_HINT_RE.search(head):
+        return "xml"
+    return None
+
+
+def _detect_format(path: str) -> Tuple[str, bool]:
+    """Pick the rdflib parser for ``path`` and whether the choice is certain.
+
+    Any specific format from the file extension is kept. For the xml/turtle case
+    the head of the file is sniffed so a wrong guess never costs a full parse.
+    """
+
+    guessed = guess_format(path)
+    if guessed not in (None, "xml", "turtle"):
+        return guessed, True
+    with open(path, "rb") as handle:
+        head = handle.read(_SNIFF_BYTES).decode("utf-8", errors="ignore").lstrip("\ufeff")
+    sniffed = _sniff_format(head)
+    if sniffed is not None:
+        return sniffed, True
+    return guessed or "turtle", False
+
+
+def _parse(path: str, fmt: str) -> Graph:
+    graph = Graph(store=_GRAPH_STORE)
+    graph.parse(path, format=fmt)
+    return graph
+
+
 def load_owl(path: str) -> OModel:
     """Load an OWL file into the intermediate :class:`OModel`."""
 
     log.info("Parsing OWL file %s", path)
-    graph = Graph()
-    fmt_candidates = []
-    guessed = guess_format(path)
-    if guessed:
-        fmt_candidates.append(guessed)
-    for fmt in ("turtle", "xml"):
-        if fmt not in fmt_candidates:
-            fmt_candidates.append(fmt)
-
-    last_error: Exception | None = None
-    for fmt in fmt_candidates:
-        log.debug("Attempting to parse %s as %s", path, fmt)
+    fmt, certain = _detect_format(path)
+    log.debug("Parsing %s as %s", path, fmt)
+    try:
+        graph = _parse(path, fmt)
+    except Exception as exc:
+        if certain:
+            log.error("Failed to parse %s as %s: %s", path, fmt, exc)
+            raise
+        # The sniff was inconclusive, so give the other format one attempt.
+        fallback = _FALLBACK_FORMAT[fmt]
+        log.warning("Failed to parse %s as %s, retrying as %s: %s", path, fmt, fallback, exc)
         try:
-            graph.parse(path, format=fmt)
-            break
-        except Exception as exc:  # pragma: no cover - executed only on parse failures
-            log.warning("Failed to parse %s as %s: %s", path, fmt, exc)
-            last_error = exc
-            graph = Graph()
-    else:  # pragma: no cover
-        if last_error:
-            raise last_error
-        raise RuntimeError(f"Unable to parse OWL file: {path}")
-
-    ontology_iri = next((str(s) for s in graph.subjects(RDF.type, OWL.Ontology)), None)
+            graph = _parse(path, fallback)
+        except Exception:
+            log.error("Failed to parse %s as %s or %s", path, fmt, fallback)
+            raise exc from None
+    return load_owl_from_graph(graph)
+
+
+def load_owl_from_graph(graph: Graph) -> OModel:
+    """Build the intermediate :class:`OModel` from an already-parsed rdflib graph.
+
+    Classes keep the graph store's triple order; :func:`load_owl` parses into a
+    store that preserves document order.
+    """
+
+    index = _index_graph(graph)
+    ontology_iri = next((str(s) for s in index.subjects(RDF.type, OWL.Ontology)), None)
     model = OModel(ontology_iri=ontology_iri)
     model.prefixes = {prefix: str(uri) for prefix, uri in graph.namespace_manager.namespaces()}
 
-    class_nodes: Set[URIRef] = set()
-    class_nodes.update({c for c in graph.subjects(RDF.type, OWL.Class) if isinstance(c, URIRef)})
-    class_nodes.update({c for c in graph.subjects(RDF.type, RDFS.Class) if isinstance(c, URIRef)})
+    # Materialize the class subjects once, in document order, for both the enum
+    # detection and the class construction passes.
+    class_nodes: List[URIRef] = list(
+        dict.fromkeys(
+            cls
+            for class_type in (OWL.Class, RDFS.Class)
+            for cls in index.subjects(RDF.type, class_type)
+            if isinstance(cls, URIRef)
+        )
+    )
 
     enum_class_iris: Set[str] = set()
     for cls in class_nodes:
-        one_of = graph.value(cls, OWL.oneOf)
+        one_of = index.one_of.get(cls)
         if one_of:
-            enum = _extract_enum(graph, cls, one_of)
+            enum = _extract_enum(index, cls, one_of)
+            model.enums[enum.iri] = enum
+            enum_class_iris.add(str(cls))
+    for cls, one_of in index.one_of.items():
+        if one_of and isinstance(cls, URIRef) and str(cls) not in enum_class_iris:
+            enum = _extract_enum(index, cls, one_of)
             model.enums[enum.iri] = enum
             enum_class_iris.add(str(cls))
-    for cls in graph.subjects(OWL.oneOf, None):
-        if isinstance(cls, URIRef) and str(cls) not in enum_class_iris:
-            one_of = graph.value(cls, OWL.oneOf)
-            if one_of:
-                enum = _extract_enum(graph, cls, one_of)
-                model.enums[enum.iri] = enum
-                enum_class_iris.add(str(cls))
-
-    # Prepopulate datatype map for common XSD entries
+
+    # Prepopulate datatype map for common XSD entries so slot ranges always resolve
     for iri, (label, base) in _XSD_TYPE_INFO.items():
         model.datatypes.setdefault(iri, ODatatype(iri=iri, label=label, base_iri=base, description=None))
 
-    _collect_properties(graph, model)
+    annotation_iris = _annotation_property_iris(index)
+    _collect_properties(index, model, annotation_iris)
 
-    for dt in graph.subjects(RDF.type, RDFS.Datatype):
+    for dt in index.subjects(RDF.type, RDFS.Datatype):
         iri = str(dt)
         if iri in model.datatypes:
             continue
-        label = _label_for(graph, dt)
-        desc = _comment(graph, dt)
-        base_val = graph.value(dt, OWL.onDatatype) or graph.value(dt, RDFS.subClassOf)
+        label = _label_for(index, dt)
+        desc = _comment(index, dt)
+        base_val = index.value(dt, OWL.onDatatype) or index.value(dt, RDFS.subClassOf)
         base_iri = str(base_val) if isinstance(base_val, URIRef) else str(XSD.string)
         model.datatypes[iri] = ODatatype(iri=iri, label=label, base_iri=base_iri, description=desc)
 
-    for cls in class_nodes:
-        cls_iri = str(cls)
-        if cls_iri in enum_class_iris:
-            continue
-        label = _label_for(graph, cls)
-        desc = _comment(graph, cls)
-        model.classes[cls_iri] = OClass(
-            iri=cls_iri,
-            label=label,
-            description=desc,
-            annotations=_collect_annotations(graph, model, cls),
+    class_refs: List[tuple[URIRef, OClass]] = [
+        (
+            cls,
+            OClass(
+                iri=str(cls),
+                label=_label_for(index, cls),
+                description=_comment(index, cls),
+                annotations=_collect_annotations(index, annotation_iris, cls),
+            ),
         )
+        for cls in class_nodes
+        if str(cls) not in enum_class_iris
+    ]
+    model.classes.update((oclass.iri, oclass) for _, oclass in class_refs)
 
-    for cls_iri, oclass in model.classes.items():
-        for sup in graph.objects(URIRef(cls_iri), RDFS.subClassOf):
+    for cls, oclass in class_refs:
+        facts = index.spo.get(cls, {})
+        for sup in facts.get(RDFS.subClassOf, ()):
             if isinstance(sup, URIRef):
                 oclass.super_iris.append(str(sup))
             elif isinstance(sup, BNode):
-                slot = _restriction_to_slot(model, graph, sup)
+                slot = _restriction_to_slot(model, index, sup)
                 if slot:
                     oclass.slots.append(slot)
-        for eq in graph.objects(URIRef(cls_iri), OWL.equivalentClass):
-            if isinstance(eq, URIRef):
-                oclass.equivalent_iris.append(str(eq))
-        for dis in graph.objects(URIRef(cls_iri), OWL.disjointWith):
-            if isinstance(dis, URIRef):
-                oclass.disjoint_iris.append(str(dis))
+        oclass.equivalent_iris.extend(_iri_strings(facts.get(OWL.equivalentClass, ())))
+        oclass.disjoint_iris.extend(_iri_strings(facts.get(OWL.disjointWith, ())))
 
+    # Slot IRIs already attached to each class, seeded from its restrictions on first use.
+    class_slot_iris: Dict[str, Set[str]] = {}
     for prop in model.properties.values():
-        slot = _slot_from_property(model, graph, prop)
+        slot = _slot_from_property(model, index, prop)
         for dom in prop.domains:
-            if dom in model.classes:
-                cls = model.classes[dom]
-                if all(existing.iri != slot.iri for existing in cls.slots):
-                    cls.slots.append(slot)
+            cls = model.classes.get(dom)
+            if cls is None:
+                continue
+            seen = class_slot_iris.get(dom)
+            if seen is None:
+                seen = class_slot_iris[dom] = {existing.iri for existing in cls.slots}
+            if slot.iri not in seen:
+                seen.add(slot.iri)
+                cls.slots.append(slot)
 
     # Individuals
-    individual_nodes: Set[URIRef] = set()
-    for subj in graph.subjects(RDF.type, OWL.NamedIndividual):
-        if isinstance(subj, URIRef):
-            individual_nodes.add(subj)
-    for subj, typ in graph.subject_objects(RDF.type):
-        if not isinstance(subj, URIRef):
-            continue
-        if isinstance(typ, URIRef) and typ in model.classes:
-            individual_nodes.add(subj)
-    for subj in individual_nodes:
-        types = [str(t) for t in graph.objects(subj, RDF.type) if isinstance(t, URIRef) and t != OWL.NamedIndividual]
-        model.individuals[str(subj)] = OIndividual(
-            iri=str(subj),
-            label=_label_for(graph, subj),
-            description=_comment(graph, subj),
-            types=types,
-            same_as=[str(sa) for sa in graph.objects(subj, OWL.sameAs) if isinstance(sa, URIRef)],
-            annotations=_collect_annotations(graph, model, subj),
-        )
+    # Named individuals plus instances of the classes kept in the model, in document order.
+    individual_nodes: Dict[URIRef, None] = {}
+    for type_node in (OWL.NamedIndividual, *(cls for cls, _ in class_refs)):
+        for subj in index.subjects(RDF.type, type_node):
+            if isinstance(subj, URIRef):
+                individual_nodes[subj] = None
+    model.individuals.update(
+        {
+            str(subj): OIndividual(
+                iri=str(subj),
+                label=_label_for(index, subj),
+                description=_comment(index, subj),
+                types=[str(t) for t in index.objects(subj, RDF.type) if isinstance(t, URIRef) and t != OWL.NamedIndividual],
+                same_as=_iri_strings(index.objects(subj, OWL.sameAs)),
+                annotations=_collect_annotations(index, annotation_iris, subj),
+            )
+            for subj in individual_nodes
+        }
+    )
 
     log.info(
         "Loaded ontology %s (%d classes, %d enums, %d datatypes)",
@@ -370,4 +540,4 @@ def load_owl(path: str) -> OModel:
     return model
 
 
-__all__ = ["load_owl"]
+__all__ = ["load_owl", "load_owl_from_graph"]
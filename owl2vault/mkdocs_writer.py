@@ -2,63 +2,94 @@
 from __future__ import annotations
 
 import logging
-import os
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Tuple
 
-import yaml
-
-from .model import OModel
-from .note_id import iri_to_note_id
+from ._writer_common import ENUM_ROW, SLOT_ROW, display_sort_key, format_cardinality, table_cell, yaml_scalar
+from .curie import CurieMap
+from .file_writer import FileWriter
+from .model import OModel, OProperty
+from .note_id import iri_to_note_ids
 
 log = logging.getLogger(__name__)
 
+# Output directory for each property kind.
+_PROPERTY_DIRS = {
+    "object": "object_properties",
+    "data": "data_properties",
+    "annotation": "annotation_properties",
+}
+
 
-def _iri_to_curie(iri: str, prefixes: Dict[str, str]) -> Optional[str]:
-    best_prefix = None
-    best_base = ""
-    for prefix, base in prefixes.items():
-        if iri.startswith(base) and len(base) > len(best_base):
-            best_prefix = prefix
-            best_base = base
-    if best_prefix is None:
-        return None
-    suffix = iri[len(best_base) :]
-    return f"{best_prefix}:{suffix}"
+class _RelativeLinks(Dict[Tuple[str, str], str]):
+    """(source directory, IRI) -> link relative to that directory, resolved once.
+
+    Source directories and ``link_map`` targets are both POSIX paths directly
+    under the docs root, so the relative link is plain string arithmetic.
+    """
+
+    def __init__(self, link_map: Dict[str, str]) -> None:
+        super().__init__()
+        self.link_map = link_map
+
+    def __missing__(self, key: Tuple[str, str]) -> str:
+        source, iri = key
+        target = self.link_map[iri]
+        source_prefix = source + "/"
+        if target.startswith(source_prefix):
+            rel = target[len(source_prefix) :]
+        else:
+            rel = "../" + target
+        self[key] = rel
+        return rel
 
 
 def _link(label: str, path: str) -> str:
     return f"[{label}]({path})"
 
 
+class _DisplayNames(Dict[str, str]):
+    """IRI -> label, else CURIE, else the IRI itself; resolved on first lookup."""
+
+    def __init__(self, label_for: Dict[str, str], curies: CurieMap) -> None:
+        super().__init__()
+        self.label_for = label_for
+        self.curies = curies
+
+    def __missing__(self, iri: str) -> str:
+        name = self[iri] = self.label_for.get(iri) or self.curies[iri] or iri
+        return name
+
+
 def _annotation_lines(
     annotations: Dict[str, list[tuple[str, bool]]],
-    link_for: Dict[str, str],
-    label_for: Dict[str, str],
-    prefixes: Dict[str, str],
-    docs_dir: Path,
-    current_dir: Path,
+    links: _RelativeLinks,
+    display: _DisplayNames,
+    current_dir: str,
 ) -> List[str]:
     lines: List[str] = []
     for pred_iri, values in annotations.items():
-        pred_label = label_for.get(pred_iri) or _iri_to_curie(pred_iri, prefixes) or pred_iri
+        pred_label = display[pred_iri]
         for val, is_iri in values:
-            display = val
-            if is_iri and val in link_for:
-                display = label_for.get(val) or val
-                rel = os.path.relpath(docs_dir / link_for[val], start=current_dir)
-                display = _link(display, rel)
-            elif is_iri:
-                display = label_for.get(val) or _iri_to_curie(val, prefixes) or val
-            lines.append(f"- {pred_label}: {display}")
+            if not is_iri:
+                shown = val
+            elif val in links.link_map:
+                shown = _link(display[val], links[current_dir, val])
+            else:
+                shown = display[val]
+            lines.append(f"- {pred_label}: {shown}")
     if not lines:
         lines.append("- None")
     return lines
 
 
-def _write_file(path: Path, heading: str, lines: List[str]) -> None:
-    content = "\n".join([f"# {heading}", "", *lines])
-    path.write_text(content + "\n", encoding="utf-8")
+def _write_file(path: Path, heading: str, lines: List[str], writer: Optional[FileWriter] = None) -> None:
+    content = "\n".join([f"# {heading}", "", *lines]) + "\n"
+    if writer is not None:
+        writer.submit(path, content)
+    else:
+        path.write_text(content, encoding="utf-8")
 
 
 def _ensure_dirs(base: Path) -> Dict[str, Path]:
@@ -76,134 +107,155 @@ def _ensure_dirs(base: Path) -> Dict[str, Path]:
     return dirs
 
 
-def _write_markdown_docs(om: OModel, docs_dir: Path, index_filename: str = "index.md") -> List[object]:
+def _write_markdown_docs(
+    om: OModel,
+    docs_dir: Path,
+    index_filename: str = "index.md",
+    writer: Optional[FileWriter] = None,
+) -> List[object]:
+    # Every page lands in one of these directories; create them once here and
+    # never per page.
     dirs = _ensure_dirs(docs_dir)
+    curies = CurieMap(om.prefixes)
 
-    class_ids = {iri: iri_to_note_id(iri) for iri in om.classes}
-    enum_ids = {iri: iri_to_note_id(iri) for iri in om.enums}
-    prop_ids = {iri: iri_to_note_id(iri) for iri in om.properties}
-    datatype_ids = {iri: iri_to_note_id(iri) for iri in om.datatypes}
-    individual_ids = {iri: iri_to_note_id(iri) for iri in om.individuals}
-
-    link_map: Dict[str, str] = {}
-    link_map.update({iri: f"classes/{nid}.md" for iri, nid in class_ids.items()})
-    link_map.update({iri: f"enums/{nid}.md" for iri, nid in enum_ids.items()})
-    link_map.update({iri: f"object_properties/{nid}.md" for iri, nid in prop_ids.items() if om.properties[iri].kind == "object"})
-    link_map.update({iri: f"data_properties/{nid}.md" for iri, nid in prop_ids.items() if om.properties[iri].kind == "data"})
-    link_map.update({iri: f"annotation_properties/{nid}.md" for iri, nid in prop_ids.items() if om.properties[iri].kind == "annotation"})
-    link_map.update({iri: f"datatypes/{nid}.md" for iri, nid in datatype_ids.items()})
-    link_map.update({iri: f"individuals/{nid}.md" for iri, nid in individual_ids.items()})
-
-    label_map: Dict[str, str] = {}
-    label_map.update({iri: cls.label or iri for iri, cls in om.classes.items()})
-    label_map.update({iri: en.label or iri for iri, en in om.enums.items()})
-    label_map.update({iri: prop.label or iri for iri, prop in om.properties.items()})
-    label_map.update({iri: dt.label or iri for iri, dt in om.datatypes.items()})
-    label_map.update({iri: ind.label or iri for iri, ind in om.individuals.items()})
-
-    # build subclass and instance lookup
-    subclasses: Dict[str, Set[str]] = {iri: set() for iri in om.classes}
-    for cls in om.classes.values():
-        for sup in cls.super_iris:
-            if sup in subclasses:
-                subclasses[sup].add(cls.iri)
+    note_ids = iri_to_note_ids(chain(om.classes, om.enums, om.properties, om.datatypes, om.individuals))
 
-    class_instances: Dict[str, Set[str]] = {iri: set() for iri in om.classes}
-    for ind in om.individuals.values():
+    # Bucket properties by kind and resolve their page paths in the same walk.
+    props_by_kind: Dict[str, List[OProperty]] = {kind: [] for kind in _PROPERTY_DIRS}
+    prop_links: Dict[str, str] = {}
+    for prop in om.properties.values():
+        folder = _PROPERTY_DIRS.get(prop.kind)
+        if folder is not None:
+            props_by_kind[prop.kind].append(prop)
+            prop_links[prop.iri] = f"{folder}/{note_ids[prop.iri]}.md"
+
+    link_map: Dict[str, str] = {iri: f"classes/{note_ids[iri]}.md" for iri in om.classes}
+    link_map.update({iri: f"enums/{note_ids[iri]}.md" for iri in om.enums})
+    link_map.update(prop_links)
+    link_map.update({iri: f"datatypes/{note_ids[iri]}.md" for iri in om.datatypes})
+    link_map.update({iri: f"individuals/{note_ids[iri]}.md" for iri in om.individuals})
+
+    links = _RelativeLinks(link_map)
+
+    # Display label per collection, falling back to the IRI when a label is empty.
+    class_label = {iri: cls.label or iri for iri, cls in om.classes.items()}
+    enum_label = {iri: en.label or iri for iri, en in om.enums.items()}
+    prop_label = {iri: prop.label or iri for iri, prop in om.properties.items()}
+    dt_label = {iri: dt.label or iri for iri, dt in om.datatypes.items()}
+    ind_label = {iri: ind.label or iri for iri, ind in om.individuals.items()}
+    label_map: Dict[str, str] = {**class_label, **enum_label, **prop_label, **dt_label, **ind_label}
+    display = _DisplayNames(label_map, curies)
+
+    # Sort each collection by display label once; the index, nav and per-class
+    # listings reuse these orders.
+    classes_sorted = sorted(om.classes.values(), key=display_sort_key)
+    enums_sorted = sorted(om.enums.values(), key=display_sort_key)
+    datatypes_sorted = sorted(om.datatypes.values(), key=display_sort_key)
+    individuals_sorted = sorted(om.individuals.values(), key=display_sort_key)
+
+    # build subclass and instance lookup; walking the sorted collections keeps
+    # each listing in display order, and consecutive repeats are dropped.
+    subclasses: Dict[str, List[str]] = {iri: [] for iri in om.classes}
+    subclasses_of = subclasses.get
+    for cls in classes_sorted:
+        iri = cls.iri
+        for sup in cls.super_iris:
+            subs = subclasses_of(sup)
+            if subs is not None and (not subs or subs[-1] != iri):
+                subs.append(iri)
+
+    class_instances: Dict[str, List[str]] = {iri: [] for iri in om.classes}
+    instances_of = class_instances.get
+    for ind in individuals_sorted:
+        iri = ind.iri
         for t in ind.types:
-            if t in class_instances:
-                class_instances[t].add(ind.iri)
+            insts = instances_of(t)
+            if insts is not None and (not insts or insts[-1] != iri):
+                insts.append(iri)
 
     # Classes
     for cls in om.classes.values():
         heading = cls.label or cls.iri
         lines: List[str] = ["## Summary", f"- Label: {cls.label or cls.iri}", f"- IRI: {cls.iri}"]
-        curie = _iri_to_curie(cls.iri, om.prefixes)
+        curie = curies[cls.iri]
         if curie:
             lines.append(f"- CURIE: {curie}")
 
-        lines.extend(["", "## Superclasses"])
+        lines.extend(("", "## Superclasses"))
         if cls.super_iris:
             for sup in cls.super_iris:
-                sup_label = om.classes.get(sup).label if sup in om.classes else sup
+                sup_label = class_label.get(sup, sup)
                 if sup in link_map:
-                    rel = os.path.relpath(docs_dir / link_map[sup], start=dirs["classes"])
+                    rel = links["classes", sup]
                     lines.append(f"- {_link(sup_label, rel)}")
                 else:
                     lines.append(f"- {sup_label}")
         else:
             lines.append("- None")
 
-        lines.extend(["", "## Subclasses"])
-        subs = subclasses.get(cls.iri, set())
+        lines.extend(("", "## Subclasses"))
+        subs = subclasses.get(cls.iri)
         if subs:
-            for sub in sorted(subs, key=lambda s: (om.classes[s].label or s).lower()):
-                label = om.classes[sub].label
-                rel = os.path.relpath(docs_dir / link_map[sub], start=dirs["classes"])
+            for sub in subs:
+                label = class_label[sub]
+                rel = links["classes", sub]
                 lines.append(f"- {_link(label, rel)}")
         else:
             lines.append("- None")
 
-        lines.extend(["", "## Properties", "| Property | Range | Card. | Description |", "| --- | --- | --- | --- |"])
+        lines.extend(("", "## Properties", "| Property | Range | Card. | Description |", "| --- | --- | --- | --- |"))
         for slot in cls.slots:
             range_label = slot.range_label
             if slot.range_iri in link_map:
-                rel = os.path.relpath(docs_dir / link_map[slot.range_iri], start=dirs["classes"])
+                rel = links["classes", slot.range_iri]
                 range_display = _link(range_label, rel)
             else:
-                curie_range = _iri_to_curie(slot.range_iri, om.prefixes)
+                curie_range = curies[slot.range_iri]
                 range_display = curie_range or range_label
-            card_disp = ""
-            if slot.min_card is not None or slot.max_card is not None:
-                if slot.min_card is not None and slot.max_card is not None and slot.min_card == slot.max_card:
-                    card_disp = str(slot.min_card)
-                else:
-                    min_part = slot.min_card if slot.min_card is not None else 0
-                    max_part = slot.max_card if slot.max_card is not None else "*"
-                    card_disp = f"{min_part}..{max_part}"
-            lines.append(f"| {slot.name} | {range_display} | {card_disp} | {slot.description or ''} |")
+            card_disp = format_cardinality(slot.min_card, slot.max_card)
+            lines.append(SLOT_ROW(slot.name, range_display, card_disp, table_cell(slot.description)))
 
-        lines.extend(["", "## Equivalent Classes"])
+        lines.extend(("", "## Equivalent Classes"))
         if cls.equivalent_iris:
             for eq in cls.equivalent_iris:
-                label = om.classes.get(eq).label if eq in om.classes else eq
+                label = class_label.get(eq, eq)
                 if eq in link_map:
-                    rel = os.path.relpath(docs_dir / link_map[eq], start=dirs["classes"])
+                    rel = links["classes", eq]
                     lines.append(f"- {_link(label, rel)}")
                 else:
                     lines.append(f"- {label}")
         else:
             lines.append("- None")
 
-        lines.extend(["", "## Disjoint Classes"])
+        lines.extend(("", "## Disjoint Classes"))
         if cls.disjoint_iris:
             for dj in cls.disjoint_iris:
-                label = om.classes.get(dj).label if dj in om.classes else dj
+                label = class_label.get(dj, dj)
                 if dj in link_map:
-                    rel = os.path.relpath(docs_dir / link_map[dj], start=dirs["classes"])
+                    rel = links["classes", dj]
                     lines.append(f"- {_link(label, rel)}")
                 else:
                     lines.append(f"- {label}")
         else:
             lines.append("- None")
 
-        lines.extend(["", "## Annotations"])
-        lines.extend(_annotation_lines(cls.annotations, link_map, label_map, om.prefixes, docs_dir, dirs["classes"]))
+        lines.extend(("", "## Annotations"))
+        lines.extend(_annotation_lines(cls.annotations, links, display, "classes"))
 
-        lines.extend(["", "## Instances"])
-        insts = class_instances.get(cls.iri, set())
+        lines.extend(("", "## Instances"))
+        insts = class_instances.get(cls.iri)
         if insts:
-            for inst in sorted(insts, key=lambda i: (om.individuals[i].label or i).lower()):
-                label = om.individuals[inst].label or inst
+            for inst in insts:
+                label = ind_label[inst]
                 if inst in link_map:
-                    rel = os.path.relpath(docs_dir / link_map[inst], start=dirs["classes"])
+                    rel = links["classes", inst]
                     lines.append(f"- {_link(label, rel)}")
                 else:
                     lines.append(f"- {label}")
         else:
             lines.append("- None")
 
-        _write_file(dirs["classes"] / f"{class_ids[cls.iri]}.md", heading, lines)
+        _write_file(dirs["classes"] / f"{note_ids[cls.iri]}.md", heading, lines, writer)
 
     # Enums
     for enum in om.enums.values():
@@ -213,13 +265,13 @@ def _write_markdown_docs(om: OModel, docs_dir: Path, index_filename: str = "inde
             f"- Label: {enum.label or enum.iri}",
             f"- IRI: {enum.iri}",
         ]
-        curie = _iri_to_curie(enum.iri, om.prefixes)
+        curie = curies[enum.iri]
         if curie:
             lines.append(f"- CURIE: {curie}")
-        lines.extend(["", "## Permissible Values", "| Code | Label | Description |", "| --- | --- | --- |"])
+        lines.extend(("", "## Permissible Values", "| Code | Label | Description |", "| --- | --- | --- |"))
         for val in enum.values:
-            lines.append(f"| {val.code} | {val.label or ''} | {val.description or ''} |")
-        _write_file(dirs["enums"] / f"{enum_ids[enum.iri]}.md", heading, lines)
+            lines.append(ENUM_ROW(val.code, val.label or "", table_cell(val.description)))
+        _write_file(dirs["enums"] / f"{note_ids[enum.iri]}.md", heading, lines, writer)
 
     # Datatypes
     for dt in om.datatypes.values():
@@ -230,108 +282,92 @@ def _write_markdown_docs(om: OModel, docs_dir: Path, index_filename: str = "inde
             f"- IRI: {dt.iri}",
             f"- Base: {dt.base_iri}",
         ]
-        _write_file(dirs["datatypes"] / f"{datatype_ids[dt.iri]}.md", heading, lines)
+        _write_file(dirs["datatypes"] / f"{note_ids[dt.iri]}.md", heading, lines, writer)
 
     # Properties
     for prop in om.properties.values():
         heading = prop.label or prop.iri
-        target_dir = dirs["object_properties"]
-        if prop.kind == "data":
-            target_dir = dirs["data_properties"]
-        elif prop.kind == "annotation":
-            target_dir = dirs["annotation_properties"]
+        target_key = _PROPERTY_DIRS.get(prop.kind, "object_properties")
         lines = [
             "## Summary",
             f"- Label: {prop.label or prop.iri}",
             f"- IRI: {prop.iri}",
             f"- Kind: {prop.kind}",
         ]
-        curie = _iri_to_curie(prop.iri, om.prefixes)
+        curie = curies[prop.iri]
         if curie:
             lines.append(f"- CURIE: {curie}")
         if prop.inverse_iris:
             inv_links = []
             for inv in prop.inverse_iris:
                 if inv in link_map:
-                    label = om.properties[inv].label or inv
-                    rel = os.path.relpath(docs_dir / link_map[inv], start=target_dir)
+                    label = prop_label.get(inv, inv)
+                    rel = links[target_key, inv]
                     inv_links.append(_link(label, rel))
                 else:
                     inv_links.append(inv)
             lines.append("- Inverse: " + ", ".join(inv_links))
 
-        lines.extend(["", "## Domains"])
+        lines.extend(("", "## Domains"))
         if prop.domains:
             for dom in prop.domains:
-                label = om.classes.get(dom).label if dom in om.classes else dom
+                label = class_label.get(dom, dom)
                 if dom in link_map:
-                    rel = os.path.relpath(docs_dir / link_map[dom], start=target_dir)
+                    rel = links[target_key, dom]
                     lines.append(f"- {_link(label, rel)}")
                 else:
                     lines.append(f"- {label}")
         else:
             lines.append("- (unspecified)")
 
-        lines.extend(["", "## Ranges"])
+        lines.extend(("", "## Ranges"))
         if prop.ranges:
             for rng in prop.ranges:
-                if rng in om.classes:
-                    label = om.classes[rng].label
-                elif rng in om.enums:
-                    label = om.enums[rng].label
-                elif rng in om.datatypes:
-                    label = om.datatypes[rng].label
-                else:
-                    label = rng
+                label = class_label.get(rng) or enum_label.get(rng) or dt_label.get(rng) or rng
                 if rng in link_map:
-                    rel = os.path.relpath(docs_dir / link_map[rng], start=target_dir)
+                    rel = links[target_key, rng]
                     lines.append(f"- {_link(label, rel)}")
                 else:
-                    curie_rng = _iri_to_curie(rng, om.prefixes)
+                    curie_rng = curies[rng]
                     lines.append(f"- {curie_rng or rng}")
         else:
             lines.append("- (unspecified)")
 
-        lines.extend(["", "## Inverse Properties"])
+        lines.extend(("", "## Inverse Properties"))
         if prop.inverse_iris:
             for inv in prop.inverse_iris:
                 if inv in link_map:
-                    label = om.properties[inv].label or inv
-                    rel = os.path.relpath(docs_dir / link_map[inv], start=target_dir)
+                    label = prop_label.get(inv, inv)
+                    rel = links[target_key, inv]
                     lines.append(f"- {_link(label, rel)}")
                 else:
                     lines.append(f"- {inv}")
         else:
             lines.append("- None")
 
-        lines.extend(["", "## Annotations"])
-        lines.extend(_annotation_lines(prop.annotations, link_map, label_map, om.prefixes, docs_dir, target_dir))
+        lines.extend(("", "## Annotations"))
+        lines.extend(_annotation_lines(prop.annotations, links, display, target_key))
 
-        lines.extend(["", "## Equivalent Properties"])
+        lines.extend(("", "## Equivalent Properties"))
         if prop.equivalent_iris:
             for eq in prop.equivalent_iris:
-                label = om.properties.get(eq).label if eq in om.properties else eq
+                label = prop_label.get(eq, eq)
                 if eq in link_map:
-                    rel = os.path.relpath(docs_dir / link_map[eq], start=target_dir)
+                    rel = links[target_key, eq]
                     lines.append(f"- {_link(label, rel)}")
                 else:
                     lines.append(f"- {label}")
         else:
             lines.append("- None")
 
-        lines.extend(["", "## Characteristics"])
+        lines.extend(("", "## Characteristics"))
         if prop.characteristics:
             for ch in prop.characteristics:
                 lines.append(f"- {ch}")
         else:
             lines.append("- None")
 
-        target_dir = dirs["object_properties"]
-        if prop.kind == "data":
-            target_dir = dirs["data_properties"]
-        elif prop.kind == "annotation":
-            target_dir = dirs["annotation_properties"]
-        _write_file(target_dir / f"{prop_ids[prop.iri]}.md", heading, lines)
+        _write_file(dirs[target_key] / f"{note_ids[prop.iri]}.md", heading, lines, writer)
 
     # Individuals
     for ind in om.individuals.values():
@@ -341,92 +377,92 @@ def _write_markdown_docs(om: OModel, docs_dir: Path, index_filename: str = "inde
             f"- Label: {ind.label or ind.iri}",
             f"- IRI: {ind.iri}",
         ]
-        curie = _iri_to_curie(ind.iri, om.prefixes)
+        curie = curies[ind.iri]
         if curie:
             lines.append(f"- CURIE: {curie}")
-        lines.extend(["", "## Types"])
+        lines.extend(("", "## Types"))
         if ind.types:
             for t in ind.types:
-                label = om.classes.get(t).label if t in om.classes else t
+                label = class_label.get(t, t)
                 if t in link_map:
-                    rel = os.path.relpath(docs_dir / link_map[t], start=dirs["individuals"])
+                    rel = links["individuals", t]
                     lines.append(f"- {_link(label, rel)}")
                 else:
-                    curie_t = _iri_to_curie(t, om.prefixes)
+                    curie_t = curies[t]
                     lines.append(f"- {curie_t or t}")
         else:
             lines.append("- None")
-        lines.extend(["", "## Annotations"])
-        lines.extend(_annotation_lines(ind.annotations, link_map, label_map, om.prefixes, docs_dir, dirs["individuals"]))
+        lines.extend(("", "## Annotations"))
+        lines.extend(_annotation_lines(ind.annotations, links, display, "individuals"))
 
-        lines.extend(["", "## Same As"])
+        lines.extend(("", "## Same As"))
         if ind.same_as:
             for sa in ind.same_as:
                 if sa in link_map:
-                    label = om.individuals.get(sa, ind).label or sa
-                    rel = os.path.relpath(docs_dir / link_map[sa], start=dirs["individuals"])
+                    label = ind_label.get(sa, sa)
+                    rel = links["individuals", sa]
                     lines.append(f"- {_link(label, rel)}")
                 else:
                     lines.append(f"- {sa}")
         else:
             lines.append("- None")
 
-        _write_file(dirs["individuals"] / f"{individual_ids[ind.iri]}.md", heading, lines)
+        _write_file(dirs["individuals"] / f"{note_ids[ind.iri]}.md", heading, lines, writer)
 
     # Index
-    index_lines: List[str] = ["# Index", "", "## Classes"]
+    index_lines: List[str] = ["## Classes"]
     if om.classes:
-        for cls in sorted(om.classes.values(), key=lambda c: (c.label or c.iri).lower()):
+        for cls in classes_sorted:
             index_lines.append(f"- {_link(cls.label or cls.iri, link_map[cls.iri])}")
     else:
         index_lines.append("- None")
 
-    index_lines.extend(["", "## Enumerations"])
+    index_lines.extend(("", "## Enumerations"))
     if om.enums:
-        for enum in sorted(om.enums.values(), key=lambda e: (e.label or e.iri).lower()):
+        for enum in enums_sorted:
             index_lines.append(f"- {_link(enum.label or enum.iri, link_map[enum.iri])}")
     else:
         index_lines.append("- None")
 
-    index_lines.extend(["", "## Object Properties"])
-    obj_props = [p for p in om.properties.values() if p.kind == "object"]
+    index_lines.extend(("", "## Object Properties"))
+    obj_props = sorted(props_by_kind["object"], key=display_sort_key)
     if obj_props:
-        for prop in sorted(obj_props, key=lambda p: (p.label or p.iri).lower()):
+        for prop in obj_props:
             index_lines.append(f"- {_link(prop.label or prop.iri, link_map[prop.iri])}")
     else:
         index_lines.append("- None")
 
-    index_lines.extend(["", "## Data Properties"])
-    data_props = [p for p in om.properties.values() if p.kind == "data"]
+    index_lines.extend(("", "## Data Properties"))
+    data_props = sorted(props_by_kind["data"], key=display_sort_key)
     if data_props:
-        for prop in sorted(data_props, key=lambda p: (p.label or p.iri).lower()):
+        for prop in data_props:
             index_lines.append(f"- {_link(prop.label or prop.iri, link_map[prop.iri])}")
     else:
         index_lines.append("- None")
 
-    index_lines.extend(["", "## Annotation Properties"])
-    ann_props = [p for p in om.properties.values() if p.kind == "annotation"]
+    index_lines.extend(("", "## Annotation Properties"))
+    ann_props = sorted(props_by_kind["annotation"], key=display_sort_key)
     if ann_props:
-        for prop in sorted(ann_props, key=lambda p: (p.label or p.iri).lower()):
+        for prop in ann_props:
             index_lines.append(f"- {_link(prop.label or prop.iri, link_map[prop.iri])}")
     else:
         index_lines.append("- None")
 
-    index_lines.extend(["", "## Datatypes"])
+    index_lines.extend(("", "## Datatypes"))
     if om.datatypes:
-        for dt in sorted(om.datatypes.values(), key=lambda d: (d.label or d.iri).lower()):
+        for dt in datatypes_sorted:
             index_lines.append(f"- {_link(dt.label or dt.iri, link_map[dt.iri])}")
     else:
         index_lines.append("- None")
 
-    index_lines.extend(["", "## Individuals"])
+    index_lines.extend(("", "## Individuals"))
     if om.individuals:
-        for ind in sorted(om.individuals.values(), key=lambda i: (i.label or i.iri).lower()):
+        for ind in individuals_sorted:
             index_lines.append(f"- {_link(ind.label or ind.iri, link_map[ind.iri])}")
     else:
         index_lines.append("- None")
 
-    (docs_dir / index_filename).write_text("\n".join(index_lines) + "\n", encoding="utf-8")
+    _write_file(docs_dir / index_filename, "Index", index_lines, writer)
 
     # mkdocs.yml
     nav: List[object] = [{"Home": index_filename}]
@@ -435,17 +471,42 @@ def _write_markdown_docs(om: OModel, docs_dir: Path, index_filename: str = "inde
             return
         nav.append({name: [{label: path} for label, path in items]})
 
-    _nav_section("Classes", [(c.label or c.iri, link_map[c.iri]) for c in sorted(om.classes.values(), key=lambda c: (c.label or c.iri).lower())])
-    _nav_section("Enumerations", [(e.label or e.iri, link_map[e.iri]) for e in sorted(om.enums.values(), key=lambda e: (e.label or e.iri).lower())])
-    _nav_section("Object Properties", [(p.label or p.iri, link_map[p.iri]) for p in sorted(obj_props, key=lambda p: (p.label or p.iri).lower())])
-    _nav_section("Data Properties", [(p.label or p.iri, link_map[p.iri]) for p in sorted(data_props, key=lambda p: (p.label or p.iri).lower())])
-    _nav_section("Annotation Properties", [(p.label or p.iri, link_map[p.iri]) for p in sorted(ann_props, key=lambda p: (p.label or p.iri).lower())])
-    _nav_section("Datatypes", [(d.label or d.iri, link_map[d.iri]) for d in sorted(om.datatypes.values(), key=lambda d: (d.label or d.iri).lower())])
-    _nav_section("Individuals", [(i.label or i.iri, link_map[i.iri]) for i in sorted(om.individuals.values(), key=lambda i: (i.label or i.iri).lower())])
+    _nav_section("Classes", [(c.label or c.iri, link_map[c.iri]) for c in classes_sorted])
+    _nav_section("Enumerations", [(e.label or e.iri, link_map[e.iri]) for e in enums_sorted])
+    _nav_section("Object Properties", [(p.label or p.iri, link_map[p.iri]) for p in obj_props])
+    _nav_section("Data Properties", [(p.label or p.iri, link_map[p.iri]) for p in data_props])
+    _nav_section("Annotation Properties", [(p.label or p.iri, link_map[p.iri]) for p in ann_props])
+    _nav_section("Datatypes", [(d.label or d.iri, link_map[d.iri]) for d in datatypes_sorted])
+    _nav_section("Individuals", [(i.label or i.iri, link_map[i.iri]) for i in individuals_sorted])
 
     return nav
 
 
+def _mkdocs_yaml(site_name: str, nav: List[object]) -> str:
+    """Render mkdocs.yml directly; the config shape is fixed, so no YAML dumper is needed."""
+
+    lines = [
+        f"site_name: {yaml_scalar(site_name)}",
+        "theme:",
+        "  name: material",
+        "plugins:",
+        "- graph",
+        "- search",
+        "- optimize",
+        "nav:",
+    ]
+    for entry in nav:
+        for name, target in entry.items():
+            if isinstance(target, list):
+                lines.append(f"- {yaml_scalar(name)}:")
+                for item in target:
+                    for label, path in item.items():
+                        lines.append(f"  - {yaml_scalar(label)}: {yaml_scalar(path)}")
+            else:
+                lines.append(f"- {yaml_scalar(name)}: {yaml_scalar(target)}")
+    return "\n".join(lines) + "\n"
+
+
 def write_mkdocs_docs(om: OModel, out_dir: str) -> None:
     """Write MkDocs project with markdown docs for the ontology."""
 
@@ -462,16 +523,10 @@ def write_mkdocs_docs(om: OModel, out_dir: str) -> None:
         len(om.individuals),
     )
 
-    nav = _write_markdown_docs(om, docs_dir, index_filename="index.md")
+    with FileWriter() as writer:
+        nav = _write_markdown_docs(om, docs_dir, index_filename="index.md", writer=writer)
 
-    mkdocs_cfg = {
-        "site_name": om.ontology_iri or "owl2vault docs",
-        "theme": {"name": "material"},
-        "plugins": ["graph", "search", "optimize"],
-        "nav": nav,
-    }
-    with open(base / "mkdocs.yml", "w", encoding="utf-8") as fh:
-        yaml.safe_dump(mkdocs_cfg, fh, sort_keys=False)
+        writer.submit(base / "mkdocs.yml", _mkdocs_yaml(om.ontology_iri or "owl2vault docs", nav))
 
 
 __all__ = ["write_mkdocs_docs", "_write_markdown_docs"]
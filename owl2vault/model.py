@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class OEnumValue:
     """Single permissible value for an enumeration."""
 
@@ -15,7 +15,7 @@ class OEnumValue:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OEnumeration:
     """Enumeration definition derived from owl:oneOf."""
 
@@ -25,7 +25,7 @@ class OEnumeration:
     values: List[OEnumValue] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class OProperty:
     """Property definition for object or annotation properties."""
 
@@ -41,7 +41,7 @@ class OProperty:
     annotations: Dict[str, List[tuple[str, bool]]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class OSlot:
     """Slot/property definition attached to a class."""
 
@@ -55,7 +55,7 @@ class OSlot:
     max_card: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OClass:
     """Class definition."""
 
@@ -69,7 +69,7 @@ class OClass:
     annotations: Dict[str, List[tuple[str, bool]]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ODatatype:
     """Datatype definition for primitive types."""
 
@@ -80,7 +80,7 @@ class ODatatype:
     pattern: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OIndividual:
     """Named individual instance."""
 
@@ -92,7 +92,7 @@ class OIndividual:
     annotations: Dict[str, List[tuple[str, bool]]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class OModel:
     """Container for ontology content."""
 
@@ -1,23 +1,52 @@
 """Helpers for converting IRIs to Obsidian-friendly note identifiers."""
 from __future__ import annotations
 
+import functools
 import hashlib
 import re
+from typing import Dict, Iterable
 from urllib.parse import urlparse
 
+_NORMALIZE_RE = re.compile(r"[^A-Za-z0-9]+")
+# Characters that make urlparse strip, split or validate beyond fragment/path/netloc.
+_URLPARSE_CHARS = frozenset("\t\r\n?;[]")
 
+
+def _base_candidate(iri: str) -> str:
+    """Readable part of ``iri``: fragment, else last path segment, else netloc.
+
+    Plain ``http(s)`` IRIs are split with string operations; anything urlparse
+    would clean up or validate first goes through urlparse.
+    """
+
+    if iri[:1] > " " and not _URLPARSE_CHARS.intersection(iri):
+        hash_pos = iri.find("#")
+        if hash_pos >= 0:
+            if hash_pos + 1 < len(iri):
+                return iri[hash_pos + 1 :]
+        elif iri.startswith(("http://", "https://")):
+            rest = iri[iri.index("//") + 2 :]
+            slash = rest.find("/")
+            if slash < 0:
+                return rest or iri
+            segment = rest[slash:].rstrip("/").rsplit("/", 1)[-1]
+            return segment or rest[:slash] or iri
+    parsed = urlparse(iri)
+    base_candidate = parsed.fragment or (parsed.path.rstrip("/").split("/")[-1] if parsed.path else "")
+    return base_candidate or parsed.netloc or iri
+
+
+@functools.lru_cache(maxsize=None)
 def iri_to_note_id(iri: str, max_base_len: int = 64, hash_len: int = 8) -> str:
     """Convert an IRI into a stable Obsidian note identifier.
 
     The identifier uses a readable base derived from the fragment, path segment,
-    or netloc and appends a short hash to avoid collisions.
+    or netloc and appends a short hash to avoid collisions. Results are cached,
+    since every writer derives the same identifiers for the same model.
     """
 
-    parsed = urlparse(iri)
-    base_candidate = parsed.fragment or (parsed.path.rstrip("/").split("/")[-1] if parsed.path else "")
-    if not base_candidate:
-        base_candidate = parsed.netloc or iri
-    normalized = re.sub(r"[^A-Za-z0-9]+", "_", base_candidate).strip("_")
+    base_candidate = _base_candidate(iri)
+    normalized = _NORMALIZE_RE.sub("_", base_candidate).strip("_")
     if not normalized:
         normalized = "node"
     if max_base_len > 0:
@@ -28,4 +57,11 @@ def iri_to_note_id(iri: str, max_base_len: int = 64, hash_len: int = 8) -> str:
     return f"{normalized}__{hash_part}"
 
 
-__all__ = ["iri_to_note_id"]
+def iri_to_note_ids(iris: Iterable[str]) -> Dict[str, str]:
+    """Map every IRI in ``iris`` to its note identifier in one pass."""
+
+    note_id = iri_to_note_id
+    return {iri: note_id(iri) for iri in iris}
+
+
+__all__ = ["iri_to_note_id", "iri_to_note_ids"]
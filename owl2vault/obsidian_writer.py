@@ -2,128 +2,152 @@
 from __future__ import annotations
 
 import logging
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-import yaml
-
-from .model import OModel
-from .note_id import iri_to_note_id
+from ._writer_common import ENUM_ROW, SLOT_ROW, display_sort_key, format_cardinality, table_cell, yaml_scalar
+from .curie import CurieMap
+from .file_writer import FileWriter
+from .model import OModel, OProperty
+from .note_id import iri_to_note_ids
 
 
 log = logging.getLogger(__name__)
 
+# Vault folder per note kind; property notes are keyed by OProperty.kind.
+_VAULT_DIRS = {
+    "classes": "Classes",
+    "enums": "Enums",
+    "object": "Object_Properties",
+    "data": "Data_Properties",
+    "annotation": "Annotation_Properties",
+    "datatypes": "Datatypes",
+    "individuals": "Individuals",
+    "index": "00-Index",
+}
+
 
-def _iri_to_curie(iri: str, prefixes: Dict[str, str]) -> Optional[str]:
-    best_prefix = None
-    best_base = ""
-    for prefix, base in prefixes.items():
-        if iri.startswith(base) and len(base) > len(best_base):
-            best_prefix = prefix
-            best_base = base
-    if best_prefix is None:
-        return None
-    suffix = iri[len(best_base) :]
-    return f"{best_prefix}:{suffix}"
+class _WikiLinks(Dict[Tuple[str, str], str]):
+    """(note_id, label) -> ``[[note_id|label]]``, formatted once per distinct pair.
 
+    One map per vault render, so every mention of a popular note shares one string.
+    """
 
-def _format_cardinality(min_card: Optional[int], max_card: Optional[int]) -> str:
-    if min_card is None and max_card is None:
-        return ""
-    if min_card is not None and max_card is not None and min_card == max_card:
-        return str(min_card)
-    min_part = "0" if min_card is None else str(min_card)
-    max_part = "*" if max_card is None else str(max_card)
-    return f"{min_part}..{max_part}"
+    def __missing__(self, key: Tuple[str, str]) -> str:
+        link = self[key] = "[[{}|{}]]".format(*key)
+        return link
 
 
 def _range_display(
-    range_iri: str,
-    range_label: str,
-    class_ids: Dict[str, str],
-    enum_ids: Dict[str, str],
-    datatype_ids: Dict[str, str],
-    individual_ids: Dict[str, str],
-    prefixes: Dict[str, str],
+    range_iri: str, range_label: str, link_map: Dict[str, str], curies: CurieMap, wiki: _WikiLinks
 ) -> str:
-    if range_iri in class_ids:
-        return f"[[{class_ids[range_iri]}|{range_label}]]"
-    if range_iri in enum_ids:
-        return f"[[{enum_ids[range_iri]}|{range_label}]]"
-    if range_iri in datatype_ids:
-        return f"[[{datatype_ids[range_iri]}|{range_label}]]"
-    if range_iri in individual_ids:
-        return f"[[{individual_ids[range_iri]}|{range_label}]]"
-    curie = _iri_to_curie(range_iri, prefixes)
-    return curie or range_label
+    note = link_map.get(range_iri)
+    if note is not None:
+        return wiki[note, range_label]
+    return curies[range_iri] or range_label
+
+
+class _AnnotationValues(Dict[str, str]):
+    """IRI annotation value -> display text, resolved on first use.
+
+    A value with a note becomes a wiki link; otherwise its label, CURIE or the
+    IRI itself is shown.
+    """
+
+    def __init__(self, link_map: Dict[str, str], label_map: Dict[str, str], curies: CurieMap, wiki: _WikiLinks) -> None:
+        super().__init__()
+        self.link_map = link_map
+        self.label_map = label_map
+        self.curies = curies
+        self.wiki = wiki
+
+    def __missing__(self, iri: str) -> str:
+        note = self.link_map.get(iri)
+        if note is not None:
+            text = self.wiki[note, self.label_map.get(iri, iri)]
+        else:
+            text = self.label_map.get(iri) or self.curies[iri] or iri
+        self[iri] = text
+        return text
 
 
 def _annotation_lines(
     annotations: Dict[str, list[tuple[str, bool]]],
-    prop_ids: Dict[str, str],
-    class_ids: Dict[str, str],
-    enum_ids: Dict[str, str],
-    datatype_ids: Dict[str, str],
-    individual_ids: Dict[str, str],
+    values: _AnnotationValues,
     label_map: Dict[str, str],
-    prefixes: Dict[str, str],
+    curies: CurieMap,
 ) -> list[str]:
     lines: list[str] = []
-    for pred_iri, values in annotations.items():
-        display_pred = label_map.get(pred_iri) or _iri_to_curie(pred_iri, prefixes) or pred_iri
-        for val, is_iri in values:
-            display_val = val
-            if is_iri:
-                if val in class_ids:
-                    display_val = f"[[{class_ids[val]}|{label_map.get(val, display_val)}]]"
-                elif val in enum_ids:
-                    display_val = f"[[{enum_ids[val]}|{label_map.get(val, display_val)}]]"
-                elif val in datatype_ids:
-                    display_val = f"[[{datatype_ids[val]}|{label_map.get(val, display_val)}]]"
-                elif val in individual_ids:
-                    display_val = f"[[{individual_ids[val]}|{label_map.get(val, display_val)}]]"
-                elif val in prop_ids:
-                    display_val = f"[[{prop_ids[val]}|{label_map.get(val, display_val)}]]"
-                else:
-                    display_val = label_map.get(val) or _iri_to_curie(val, prefixes) or val
-            lines.append(f"- {display_pred}: {display_val}")
+    for pred_iri, pred_values in annotations.items():
+        display_pred = label_map.get(pred_iri) or curies[pred_iri] or pred_iri
+        for val, is_iri in pred_values:
+            lines.append(f"- {display_pred}: {values[val] if is_iri else val}")
     if not lines:
         lines.append("- None")
     return lines
 
 
-def _write_note(path: Path, front_matter: Dict[str, object], body_lines: list[str]) -> None:
-    fm_text = yaml.safe_dump(front_matter, sort_keys=False).rstrip()
-    content = "---\n" + fm_text + "\n---\n\n" + "\n".join(body_lines) + "\n"
-    path.write_text(content, encoding="utf-8")
+def _front_matter_template(note_type: str):
+    """Return a formatter for ``note_type`` front matter taking quoted iri, curie, label and note_id."""
+
+    kind = yaml_scalar(note_type)
+    return f"iri: {{}}\ncurie: {{}}\nlabel: {{}}\nnote_id: {{}}\ntype: {kind}\ntags:\n- {kind}".format
+
+
+_CLASS_FRONT_MATTER = _front_matter_template("class")
+_ENUM_FRONT_MATTER = _front_matter_template("enum")
+_DATATYPE_FRONT_MATTER = _front_matter_template("datatype")
+_INDIVIDUAL_FRONT_MATTER = _front_matter_template("individual")
+_PROPERTY_FRONT_MATTER = {kind: _front_matter_template(f"{kind}_property") for kind in ("object", "data", "annotation")}
+_INDEX_FRONT_MATTER = "type: index\nlabel: Index\ntags:\n- index"
+
+
+def _front_matter(template, iri: str, curie: Optional[str], label: Optional[str], note_id: str) -> str:
+    return template(
+        yaml_scalar(iri),
+        "null" if curie is None else yaml_scalar(curie),
+        "null" if label is None else yaml_scalar(label),
+        yaml_scalar(note_id),
+    )
+
+
+def _write_note(
+    path: Path, front_matter: str, body_lines: list[str], writer: Optional[FileWriter] = None
+) -> None:
+    # One join builds the whole note, so the body is never materialized on its own.
+    content = "\n".join(["---", front_matter, "---", "", *body_lines, ""])
+    if writer is not None:
+        writer.submit(path, content)
+    else:
+        path.write_bytes(content.encode("utf-8"))
+
+
+def _ensure_dirs(base_dir: Path) -> Dict[str, Path]:
+    dirs = {key: base_dir / name for key, name in _VAULT_DIRS.items()}
+    for path in dirs.values():
+        path.mkdir(parents=True, exist_ok=True)
+    return dirs
 
 
 def _write_class_notes(
     om: OModel,
-    base_dir: Path,
+    dirs: Dict[str, Path],
+    curies: CurieMap,
     class_ids: Dict[str, str],
-    enum_ids: Dict[str, str],
-    datatype_ids: Dict[str, str],
-    individual_ids: Dict[str, str],
-    prop_ids: Dict[str, str],
+    link_map: Dict[str, str],
     label_map: Dict[str, str],
+    wiki: _WikiLinks,
+    annotation_values: _AnnotationValues,
+    writer: Optional[FileWriter] = None,
 ) -> None:
-    class_dir = base_dir / "Classes"
-    class_dir.mkdir(parents=True, exist_ok=True)
 
     for cls in om.classes.values():
         note_id = class_ids[cls.iri]
         log.debug("Writing class note %s -> %s", cls.label, note_id)
-        curie = _iri_to_curie(cls.iri, om.prefixes)
+        curie = curies[cls.iri]
         heading = cls.label or cls.iri
-        front = {
-            "iri": cls.iri,
-            "curie": curie,
-            "label": cls.label,
-            "note_id": note_id,
-            "type": "class",
-            "tags": ["class"],
-        }
+        front = _front_matter(_CLASS_FRONT_MATTER, cls.iri, curie, cls.label, note_id)
 
         body: list[str] = [
             f"# {heading}",
@@ -133,61 +157,51 @@ def _write_class_notes(
             f"- CURIE: {curie or ''}",
             f"- IRI: {cls.iri}",
         ]
-        body.extend(["", "## Superclasses"])
+        body.extend(("", "## Superclasses"))
         if cls.super_iris:
             for sup in cls.super_iris:
-                sup_label = om.classes.get(sup).label if sup in om.classes else sup
-                if sup in class_ids:
-                    body.append(f"- [[{class_ids[sup]}|{sup_label}]]")
+                sup_label = label_map.get(sup, sup)
+                sup_note = class_ids.get(sup)
+                if sup_note is not None:
+                    body.append(f"- {wiki[sup_note, sup_label]}")
                 else:
                     body.append(f"- {sup_label}")
         else:
             body.append("- None")
 
-        body.extend(["", "## Properties", "| Property | Range | Card. | Description |", "| --- | --- | --- | --- |"])
+        body.extend(("", "## Properties", "| Property | Range | Card. | Description |", "| --- | --- | --- | --- |"))
         for slot in cls.slots:
-            range_disp = _range_display(
-                slot.range_iri, slot.range_label, class_ids, enum_ids, datatype_ids, individual_ids, om.prefixes
-            )
-            card_disp = _format_cardinality(slot.min_card, slot.max_card)
-            body.append(
-                f"| {slot.name} | {range_disp} | {card_disp} | {slot.description or ''} |"
-            )
+            range_disp = _range_display(slot.range_iri, slot.range_label, link_map, curies, wiki)
+            card_disp = format_cardinality(slot.min_card, slot.max_card)
+            body.append(SLOT_ROW(slot.name, range_disp, card_disp, table_cell(slot.description)))
 
-        body.extend(["", "## Annotations"])
+        body.extend(("", "## Annotations"))
         body.extend(
             _annotation_lines(
                 cls.annotations,
-                prop_ids=prop_ids,
-                class_ids=class_ids,
-                enum_ids=enum_ids,
-                datatype_ids=datatype_ids,
-                individual_ids=individual_ids,
+                values=annotation_values,
                 label_map=label_map,
-                prefixes=om.prefixes,
+                curies=curies,
             )
         )
 
-        _write_note(class_dir / f"{note_id}.md", front, body)
+        _write_note(dirs["classes"] / f"{note_id}.md", front, body, writer)
 
 
-def _write_enum_notes(om: OModel, base_dir: Path, enum_ids: Dict[str, str]) -> None:
-    enum_dir = base_dir / "Enums"
-    enum_dir.mkdir(parents=True, exist_ok=True)
+def _write_enum_notes(
+    om: OModel,
+    dirs: Dict[str, Path],
+    curies: CurieMap,
+    enum_ids: Dict[str, str],
+    writer: Optional[FileWriter] = None,
+) -> None:
 
     for enum in om.enums.values():
         note_id = enum_ids[enum.iri]
         log.debug("Writing enum note %s -> %s", enum.label, note_id)
-        curie = _iri_to_curie(enum.iri, om.prefixes)
+        curie = curies[enum.iri]
         heading = enum.label or enum.iri
-        front = {
-            "iri": enum.iri,
-            "curie": curie,
-            "label": enum.label,
-            "note_id": note_id,
-            "type": "enum",
-            "tags": ["enum"],
-        }
+        front = _front_matter(_ENUM_FRONT_MATTER, enum.iri, curie, enum.label, note_id)
 
         body: list[str] = [
             f"# {heading}",
@@ -197,31 +211,26 @@ def _write_enum_notes(om: OModel, base_dir: Path, enum_ids: Dict[str, str]) -> N
             f"- CURIE: {curie or ''}",
             f"- IRI: {enum.iri}",
         ]
-        body.extend(["", "## Permissible Values", "| Code | Label | Description |", "| --- | --- | --- |"])
+        body.extend(("", "## Permissible Values", "| Code | Label | Description |", "| --- | --- | --- |"))
         for val in enum.values:
-            body.append(
-                f"| {val.code} | {val.label or ''} | {val.description or ''} |"
-            )
+            body.append(ENUM_ROW(val.code, val.label or "", table_cell(val.description)))
 
-        _write_note(enum_dir / f"{note_id}.md", front, body)
+        _write_note(dirs["enums"] / f"{note_id}.md", front, body, writer)
 
 
-def _write_datatype_notes(om: OModel, base_dir: Path, datatype_ids: Dict[str, str]) -> None:
-    dt_dir = base_dir / "Datatypes"
-    dt_dir.mkdir(parents=True, exist_ok=True)
+def _write_datatype_notes(
+    om: OModel,
+    dirs: Dict[str, Path],
+    curies: CurieMap,
+    datatype_ids: Dict[str, str],
+    writer: Optional[FileWriter] = None,
+) -> None:
 
     for dt in om.datatypes.values():
         note_id = datatype_ids[dt.iri]
-        curie = _iri_to_curie(dt.iri, om.prefixes)
+        curie = curies[dt.iri]
         heading = dt.label or dt.iri
-        front = {
-            "iri": dt.iri,
-            "curie": curie,
-            "label": dt.label,
-            "note_id": note_id,
-            "type": "datatype",
-            "tags": ["datatype"],
-        }
+        front = _front_matter(_DATATYPE_FRONT_MATTER, dt.iri, curie, dt.label, note_id)
         body: list[str] = [
             f"# {heading}",
             "",
@@ -231,39 +240,28 @@ def _write_datatype_notes(om: OModel, base_dir: Path, datatype_ids: Dict[str, st
             f"- IRI: {dt.iri}",
             f"- Base: {dt.base_iri}",
         ]
-        _write_note(dt_dir / f"{note_id}.md", front, body)
+        _write_note(dirs["datatypes"] / f"{note_id}.md", front, body, writer)
 
 
 def _write_property_notes(
     om: OModel,
-    base_dir: Path,
+    dirs: Dict[str, Path],
+    curies: CurieMap,
     class_ids: Dict[str, str],
-    enum_ids: Dict[str, str],
-    datatype_ids: Dict[str, str],
-    individual_ids: Dict[str, str],
     prop_ids: Dict[str, str],
+    link_map: Dict[str, str],
     label_map: Dict[str, str],
+    props_by_kind: Dict[str, List[OProperty]],
+    wiki: _WikiLinks,
+    annotation_values: _AnnotationValues,
+    writer: Optional[FileWriter] = None,
 ) -> None:
-    prop_dirs = {
-        "object": base_dir / "Object_Properties",
-        "data": base_dir / "Data_Properties",
-        "annotation": base_dir / "Annotation_Properties",
-    }
-    for path in prop_dirs.values():
-        path.mkdir(parents=True, exist_ok=True)
 
-    for prop in om.properties.values():
+    for prop in chain.from_iterable(props_by_kind.values()):
         note_id = prop_ids[prop.iri]
-        curie = _iri_to_curie(prop.iri, om.prefixes)
+        curie = curies[prop.iri]
         heading = prop.label or prop.iri
-        front = {
-            "iri": prop.iri,
-            "curie": curie,
-            "label": prop.label,
-            "note_id": note_id,
-            "type": f"{prop.kind}_property",
-            "tags": [f"{prop.kind}_property"],
-        }
+        front = _front_matter(_PROPERTY_FRONT_MATTER[prop.kind], prop.iri, curie, prop.label, note_id)
 
         body: list[str] = [
             f"# {heading}",
@@ -273,91 +271,71 @@ def _write_property_notes(
             f"- CURIE: {curie or ''}",
             f"- IRI: {prop.iri}",
         ]
-        body.extend(["", "## Domains"])
+        body.extend(("", "## Domains"))
         if prop.domains:
             for dom in prop.domains:
-                label = om.classes.get(dom).label if dom in om.classes else dom
-                if dom in class_ids:
-                    body.append(f"- [[{class_ids[dom]}|{label}]]")
+                label = label_map.get(dom, dom)
+                dom_note = class_ids.get(dom)
+                if dom_note is not None:
+                    body.append(f"- {wiki[dom_note, label]}")
                 else:
                     body.append(f"- {label}")
         else:
             body.append("- (unspecified)")
 
-        body.extend(["", "## Ranges"])
+        body.extend(("", "## Ranges"))
         if prop.ranges:
             for rng in prop.ranges:
-                if rng in class_ids:
-                    label = om.classes[rng].label
-                    body.append(f"- [[{class_ids[rng]}|{label}]]")
-                elif rng in enum_ids:
-                    label = om.enums[rng].label
-                    body.append(f"- [[{enum_ids[rng]}|{label}]]")
-                elif rng in datatype_ids:
-                    label = om.datatypes[rng].label
-                    body.append(f"- [[{datatype_ids[rng]}|{label}]]")
-                elif rng in individual_ids:
-                    label = om.individuals[rng].label
-                    body.append(f"- [[{individual_ids[rng]}|{label}]]")
+                rng_note = link_map.get(rng)
+                if rng_note is not None:
+                    body.append(f"- {wiki[rng_note, label_map.get(rng, rng)]}")
                 else:
-                    curie_rng = _iri_to_curie(rng, om.prefixes)
+                    curie_rng = curies[rng]
                     body.append(f"- {curie_rng or rng}")
         else:
             body.append("- (unspecified)")
 
-        body.extend(["", "## Inverse Properties"])
+        body.extend(("", "## Inverse Properties"))
         if prop.inverse_iris:
             for inv in prop.inverse_iris:
-                if inv in prop_ids:
-                    label = om.properties[inv].label
-                    body.append(f"- [[{prop_ids[inv]}|{label}]]")
+                inv_note = prop_ids.get(inv)
+                if inv_note is not None:
+                    body.append(f"- {wiki[inv_note, label_map.get(inv, inv)]}")
                 else:
                     body.append(f"- {inv}")
         else:
             body.append("- None")
 
-        body.extend(["", "## Annotations"])
+        body.extend(("", "## Annotations"))
         body.extend(
             _annotation_lines(
                 prop.annotations,
-                prop_ids=prop_ids,
-                class_ids=class_ids,
-                enum_ids=enum_ids,
-                datatype_ids=datatype_ids,
-                individual_ids=individual_ids,
+                values=annotation_values,
                 label_map=label_map,
-                prefixes=om.prefixes,
+                curies=curies,
             )
         )
 
-        _write_note(prop_dirs[prop.kind] / f"{note_id}.md", front, body)
+        _write_note(dirs[prop.kind] / f"{note_id}.md", front, body, writer)
 
 
 def _write_individual_notes(
     om: OModel,
-    base_dir: Path,
+    dirs: Dict[str, Path],
+    curies: CurieMap,
     class_ids: Dict[str, str],
-    enum_ids: Dict[str, str],
-    datatype_ids: Dict[str, str],
     individual_ids: Dict[str, str],
-    prop_ids: Dict[str, str],
     label_map: Dict[str, str],
+    wiki: _WikiLinks,
+    annotation_values: _AnnotationValues,
+    writer: Optional[FileWriter] = None,
 ) -> None:
-    ind_dir = base_dir / "Individuals"
-    ind_dir.mkdir(parents=True, exist_ok=True)
 
     for ind in om.individuals.values():
         note_id = individual_ids[ind.iri]
-        curie = _iri_to_curie(ind.iri, om.prefixes)
+        curie = curies[ind.iri]
         heading = ind.label or ind.iri
-        front = {
-            "iri": ind.iri,
-            "curie": curie,
-            "label": ind.label,
-            "note_id": note_id,
-            "type": "individual",
-            "tags": ["individual"],
-        }
+        front = _front_matter(_INDIVIDUAL_FRONT_MATTER, ind.iri, curie, ind.label, note_id)
         body: list[str] = [
             f"# {heading}",
             "",
@@ -366,44 +344,41 @@ def _write_individual_notes(
             f"- CURIE: {curie or ''}",
             f"- IRI: {ind.iri}",
         ]
-        body.extend(["", "## Types"])
+        body.extend(("", "## Types"))
         if ind.types:
             for t in ind.types:
-                if t in class_ids:
-                    body.append(f"- [[{class_ids[t]}|{om.classes[t].label}]]")
+                type_note = class_ids.get(t)
+                if type_note is not None:
+                    body.append(f"- {wiki[type_note, label_map.get(t, t)]}")
                 else:
-                    curie_t = _iri_to_curie(t, om.prefixes)
+                    curie_t = curies[t]
                     body.append(f"- {curie_t or t}")
         else:
             body.append("- None")
 
-        body.extend(["", "## Annotations"])
+        body.extend(("", "## Annotations"))
         body.extend(
             _annotation_lines(
                 ind.annotations,
-                prop_ids=prop_ids,
-                class_ids=class_ids,
-                enum_ids=enum_ids,
-                datatype_ids=datatype_ids,
-                individual_ids=individual_ids,
+                values=annotation_values,
                 label_map=label_map,
-                prefixes=om.prefixes,
+                curies=curies,
             )
         )
-        _write_note(ind_dir / f"{note_id}.md", front, body)
+        _write_note(dirs["individuals"] / f"{note_id}.md", front, body, writer)
 
 
 def _write_index(
     om: OModel,
-    base_dir: Path,
+    dirs: Dict[str, Path],
     class_ids: Dict[str, str],
     enum_ids: Dict[str, str],
     datatype_ids: Dict[str, str],
     individual_ids: Dict[str, str],
     prop_ids: Dict[str, str],
+    props_by_kind: Dict[str, List[OProperty]],
+    writer: Optional[FileWriter] = None,
 ) -> None:
-    index_dir = base_dir / "00-Index"
-    index_dir.mkdir(parents=True, exist_ok=True)
 
     lines: list[str] = ["# Index", "", "## Classes"]
     if om.classes:
@@ -412,52 +387,52 @@ def _write_index(
     else:
         lines.append("- None")
 
-    lines.extend(["", "## Enumerations"])
+    lines.extend(("", "## Enumerations"))
     if om.enums:
         for enum in sorted(om.enums.values(), key=lambda e: e.label.lower()):
             lines.append(f"- [[{enum_ids[enum.iri]}|{enum.label}]]")
     else:
         lines.append("- None")
 
-    lines.extend(["", "## Object Properties"])
-    obj_props = [p for p in om.properties.values() if p.kind == "object"]
+    lines.extend(("", "## Object Properties"))
+    obj_props = props_by_kind["object"]
     if obj_props:
-        for prop in sorted(obj_props, key=lambda p: (p.label or p.iri).lower()):
+        for prop in obj_props:
             lines.append(f"- [[{prop_ids[prop.iri]}|{prop.label or prop.iri}]]")
     else:
         lines.append("- None")
 
-    lines.extend(["", "## Data Properties"])
-    data_props = [p for p in om.properties.values() if p.kind == "data"]
+    lines.extend(("", "## Data Properties"))
+    data_props = props_by_kind["data"]
     if data_props:
-        for prop in sorted(data_props, key=lambda p: (p.label or p.iri).lower()):
+        for prop in data_props:
             lines.append(f"- [[{prop_ids[prop.iri]}|{prop.label or prop.iri}]]")
     else:
         lines.append("- None")
 
-    lines.extend(["", "## Annotation Properties"])
-    ann_props = [p for p in om.properties.values() if p.kind == "annotation"]
+    lines.extend(("", "## Annotation Properties"))
+    ann_props = props_by_kind["annotation"]
     if ann_props:
-        for prop in sorted(ann_props, key=lambda p: (p.label or p.iri).lower()):
+        for prop in ann_props:
             lines.append(f"- [[{prop_ids[prop.iri]}|{prop.label or prop.iri}]]")
     else:
         lines.append("- None")
 
-    lines.extend(["", "## Datatypes"])
+    lines.extend(("", "## Datatypes"))
     if om.datatypes:
         for dt in sorted(om.datatypes.values(), key=lambda d: d.label.lower()):
             lines.append(f"- [[{datatype_ids[dt.iri]}|{dt.label}]]")
     else:
         lines.append("- None")
 
-    lines.extend(["", "## Individuals"])
+    lines.extend(("", "## Individuals"))
     if om.individuals:
-        for ind in sorted(om.individuals.values(), key=lambda i: (i.label or i.iri).lower()):
+        for ind in sorted(om.individuals.values(), key=display_sort_key):
             lines.append(f"- [[{individual_ids[ind.iri]}|{ind.label or ind.iri}]]")
     else:
         lines.append("- None")
 
-    _write_note(index_dir / "Index.md", {"type": "index", "label": "Index", "tags": ["index"]}, lines)
+    _write_note(dirs["index"] / "Index.md", _INDEX_FRONT_MATTER, lines, writer)
 
 
 def write_obsidian_vault(om: OModel, out_dir: str) -> None:
@@ -473,25 +448,54 @@ def write_obsidian_vault(om: OModel, out_dir: str) -> None:
         len(om.datatypes),
         len(om.individuals),
     )
-    class_ids = {iri: iri_to_note_id(iri) for iri in om.classes}
-    enum_ids = {iri: iri_to_note_id(iri) for iri in om.enums}
-    datatype_ids = {iri: iri_to_note_id(iri) for iri in om.datatypes}
-    prop_ids = {iri: iri_to_note_id(iri) for iri in om.properties}
-    individual_ids = {iri: iri_to_note_id(iri) for iri in om.individuals}
-
-    label_map: Dict[str, str] = {}
-    label_map.update({iri: cls.label or iri for iri, cls in om.classes.items()})
-    label_map.update({iri: en.label or iri for iri, en in om.enums.items()})
-    label_map.update({iri: prop.label or iri for iri, prop in om.properties.items()})
-    label_map.update({iri: dt.label or iri for iri, dt in om.datatypes.items()})
-    label_map.update({iri: ind.label or iri for iri, ind in om.individuals.items()})
-
-    _write_class_notes(om, base_dir, class_ids, enum_ids, datatype_ids, individual_ids, prop_ids, label_map)
-    _write_enum_notes(om, base_dir, enum_ids)
-    _write_property_notes(om, base_dir, class_ids, enum_ids, datatype_ids, individual_ids, prop_ids, label_map)
-    _write_datatype_notes(om, base_dir, datatype_ids)
-    _write_individual_notes(om, base_dir, class_ids, enum_ids, datatype_ids, individual_ids, prop_ids, label_map)
-    _write_index(om, base_dir, class_ids, enum_ids, datatype_ids, individual_ids, prop_ids)
+    # Every entity's note, whatever its kind, so link targets resolve with one
+    # probe; the per-kind views below reuse these IDs instead of recomputing them.
+    link_map = iri_to_note_ids(chain(om.classes, om.enums, om.datatypes, om.properties, om.individuals))
+    class_ids = {iri: link_map[iri] for iri in om.classes}
+    enum_ids = {iri: link_map[iri] for iri in om.enums}
+    datatype_ids = {iri: link_map[iri] for iri in om.datatypes}
+    prop_ids = {iri: link_map[iri] for iri in om.properties}
+    individual_ids = {iri: link_map[iri] for iri in om.individuals}
+
+    # Later collections win for shared IRIs, as with sequential updates.
+    label_map: Dict[str, str] = {
+        iri: entity.label or iri
+        for iri, entity in chain(
+            om.classes.items(), om.enums.items(), om.properties.items(), om.datatypes.items(), om.individuals.items()
+        )
+    }
+
+    # Partition properties by kind in one pass; each bucket is sorted once for
+    # the index and the property notes walk the same buckets.
+    props_by_kind: Dict[str, List[OProperty]] = {"object": [], "data": [], "annotation": []}
+    for prop in om.properties.values():
+        props_by_kind[prop.kind].append(prop)
+    for props in props_by_kind.values():
+        props.sort(key=display_sort_key)
+
+    # One CURIE memo per render: each IRI is compacted against the prefix index
+    # on first mention and served from the map afterwards.
+    curies = CurieMap(om.prefixes)
+    wiki = _WikiLinks()
+    annotation_values = _AnnotationValues(link_map, label_map, curies, wiki)
+
+    # Every note lands in one of these folders; create them once up front.
+    dirs = _ensure_dirs(base_dir)
+
+    # Notes are rendered here and written by the background writer threads.
+    with FileWriter() as writer:
+        _write_class_notes(om, dirs, curies, class_ids, link_map, label_map, wiki, annotation_values, writer)
+        _write_enum_notes(om, dirs, curies, enum_ids, writer)
+        _write_property_notes(
+            om, dirs, curies, class_ids, prop_ids, link_map, label_map, props_by_kind, wiki, annotation_values, writer
+        )
+        _write_datatype_notes(om, dirs, curies, datatype_ids, writer)
+        _write_individual_notes(
+            om, dirs, curies, class_ids, individual_ids, label_map, wiki, annotation_values, writer
+        )
+        _write_index(
+            om, dirs, class_ids, enum_ids, datatype_ids, individual_ids, prop_ids, props_by_kind, writer
+        )
 
 
 __all__ = ["write_obsidian_vault"]
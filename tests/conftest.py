@@ -1,9 +1,135 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Tuple
+
+import pytest
+import yaml
+from rdflib import Graph
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeLoader as _YamlLoader
 
 # Ensure the repository root (package) is importable when running tests without installation.
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+# Importing the CLI pulls in the loader and every writer, so none of that import
+# time lands inside the first test that happens to touch them.
+import owl2vault.cli  # noqa: E402,F401
+from owl2vault.docsify_writer import write_docsify_docs  # noqa: E402
+from owl2vault.hugo_writer import write_hugo_site  # noqa: E402
+from owl2vault.linkml_writer import write_linkml_yaml  # noqa: E402
+from owl2vault.loader import load_owl_from_graph  # noqa: E402
+from owl2vault.mkdocs_writer import write_mkdocs_docs  # noqa: E402
+from owl2vault.model import OModel  # noqa: E402
+from owl2vault.obsidian_writer import write_obsidian_vault  # noqa: E402
+
+
+# The smoke-test ontology. Kept as Turtle text so the fixture is a single parse
+# rather than a triple-by-triple build and a serialize.
+SMOKE_TTL = """\
+@prefix ex: <http://example.org/> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+ex:ClassA a owl:Class ;
+    rdfs:label "Class A" ;
+    rdfs:subClassOf [ a owl:Restriction ;
+            owl:onProperty ex:hasName ;
+            owl:someValuesFrom xsd:string ;
+            owl:minCardinality 1 ] ;
+    ex:note "Example note",
+        ex:hasName .
+
+ex:ClassB a owl:Class ;
+    rdfs:label "Class B" ;
+    rdfs:subClassOf ex:ClassA .
+
+ex:hasName a owl:DatatypeProperty ;
+    rdfs:label "Has Name" .
+
+ex:note a owl:AnnotationProperty ;
+    rdfs:label "Note" ;
+    rdfs:domain ex:ClassA ;
+    rdfs:range xsd:string .
+
+# Individual (not explicitly typed as NamedIndividual)
+ex:Instance1 a ex:ClassA ;
+    rdfs:label "Instance 1" .
+
+ex:Color a owl:Class ;
+    rdfs:label "Color" ;
+    owl:oneOf ( ex:Red ex:Blue ) .
+
+ex:Red rdfs:label "Red" .
+
+ex:Blue rdfs:label "Blue" .
+"""
+
+
+@pytest.fixture(scope="session")
+def smoke_graph() -> Tuple[Graph, bytes]:
+    """The smoke-test ontology, parsed once per session, with its Turtle bytes."""
+
+    turtle_bytes = SMOKE_TTL.encode("utf-8")
+    return Graph().parse(data=turtle_bytes, format="turtle"), turtle_bytes
+
+
+@pytest.fixture(scope="session")
+def model(smoke_graph: Tuple[Graph, bytes]) -> OModel:
+    """The smoke ontology loaded once, straight from the graph, for every writer test."""
+
+    graph, _ = smoke_graph
+    return load_owl_from_graph(graph)
+
+
+@dataclass(frozen=True)
+class BuiltOutputs:
+    linkml: Path
+    vault: Path
+    mkdocs: Path
+    docsify: Path
+    hugo: Path
+
+
+@pytest.fixture(scope="session")
+def built_outputs(tmp_path_factory: pytest.TempPathFactory, model: OModel) -> BuiltOutputs:
+    """Every writer run once over the smoke model, the site writers concurrently; tests only read the results."""
+
+    root = tmp_path_factory.mktemp("out")
+    outputs = BuiltOutputs(
+        linkml=root / "schema.yaml",
+        vault=root / "vault",
+        mkdocs=root / "mkdocs",
+        docsify=root / "docsify",
+        hugo=root / "hugo",
+    )
+    site_writers = (
+        (write_obsidian_vault, outputs.vault),
+        (write_mkdocs_docs, outputs.mkdocs),
+        (write_docsify_docs, outputs.docsify),
+        (write_hugo_site, outputs.hugo),
+    )
+    # The site writers share one model concurrently, as the CLI's parallel mode does.
+    with ThreadPoolExecutor(max_workers=len(site_writers)) as pool:
+        futures = [pool.submit(write, model, str(path)) for write, path in site_writers]
+        write_linkml_yaml(model, str(outputs.linkml))
+        for future in futures:
+            future.result()
+    return outputs
+
+
+@pytest.fixture(scope="session")
+def yaml_load() -> Callable[[str], Any]:
+    """Safe YAML loading through libyaml when it is available."""
+
+    return lambda text: yaml.load(text, Loader=_YamlLoader)
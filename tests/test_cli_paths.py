@@ -18,17 +18,17 @@ def test_cli_warns_and_exits_when_output_dirs_missing(tmp_path: Path, monkeypatc
         return OModel(ontology_iri=None)
 
     monkeypatch.setattr(cli, "load_owl", _fake_load)
+    caplog.set_level(logging.WARNING)
 
-    with caplog.at_level(logging.WARNING):
-        with pytest.raises(SystemExit):
-            cli.main(
-                [
-                    "-i",
-                    "input.owl",
-                    "--linkml",
-                    str(missing_linkml),
-                ]
-            )
+    with pytest.raises(SystemExit):
+        cli.main(
+            [
+                "-i",
+                "input.owl",
+                "--linkml",
+                str(missing_linkml),
+            ]
+        )
 
     assert "--linkml parent directory does not exist" in caplog.text
     assert called["load"] is False
@@ -43,11 +43,8 @@ def test_cli_creates_missing_dirs_when_requested(tmp_path: Path, monkeypatch: py
     hugo = out_root / "hugo"
 
     monkeypatch.setattr(cli, "load_owl", lambda _: OModel(ontology_iri=None))
-    monkeypatch.setattr(cli, "write_linkml_yaml", lambda *_: None)
-    monkeypatch.setattr(cli, "write_obsidian_vault", lambda *_: None)
-    monkeypatch.setattr(cli, "write_mkdocs_docs", lambda *_: None)
-    monkeypatch.setattr(cli, "write_docsify_docs", lambda *_: None)
-    monkeypatch.setattr(cli, "write_hugo_site", lambda *_: None)
+    for name in ("write_linkml_yaml", "write_obsidian_vault", "write_mkdocs_docs", "write_docsify_docs", "write_hugo_site"):
+        monkeypatch.setattr(cli, name, lambda *_: None)
 
     cli.main(
         [
@@ -72,3 +69,64 @@ def test_cli_creates_missing_dirs_when_requested(tmp_path: Path, monkeypatch: py
     assert mkdocs.is_dir()
     assert docsify.is_dir()
     assert hugo.is_dir()
+
+
+def test_cli_downloads_url_to_temp_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "remote.ttl"
+    source.write_text("@prefix ex: <http://example.org/> .\n", encoding="utf-8")
+    seen: dict[str, str] = {}
+
+    def _fake_load(path: str) -> OModel:
+        seen["name"] = Path(path).name
+        seen["text"] = Path(path).read_text(encoding="utf-8")
+        return OModel(ontology_iri=None)
+
+    monkeypatch.setattr(cli, "load_owl", _fake_load)
+
+    cli.main(["--url", source.as_uri()])
+
+    assert seen["name"] == "remote.ttl"
+    assert seen["text"] == source.read_text(encoding="utf-8")
+
+
+def test_cli_parallel_writers_produce_all_outputs(tmp_path: Path) -> None:
+    source = tmp_path / "schema.ttl"
+    source.write_text(
+        "\n".join(
+            [
+                "@prefix ex: <http://example.org/> .",
+                "@prefix owl: <http://www.w3.org/2002/07/owl#> .",
+                "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .",
+                "ex:Thing a owl:Class ; rdfs:label \"Thing\" .",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    linkml = tmp_path / "schema.yaml"
+    vault = tmp_path / "vault"
+
+    cli.main(
+        [
+            "-i",
+            str(source),
+            "--create-dirs",
+            "--parallel-writers",
+            "--linkml",
+            str(linkml),
+            "--vault",
+            str(vault),
+        ]
+    )
+
+    assert "Thing" in linkml.read_text(encoding="utf-8")
+    assert (vault / "00-Index" / "Index.md").exists()
+
+
+def test_cli_rejects_file_as_output_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    not_a_dir = tmp_path / "vault.txt"
+    not_a_dir.write_text("", encoding="utf-8")
+    monkeypatch.setattr(cli, "load_owl", lambda _: OModel(ontology_iri=None))
+
+    with pytest.raises(SystemExit, match="--vault must be a directory"):
+        cli.main(["-i", "input.owl", "--vault", str(not_a_dir)])
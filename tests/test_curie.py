@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from owl2vault.curie import CurieMap, prefix_index, to_qname
+
+
+def test_longest_base_wins_and_ties_keep_declaration_order() -> None:
+    index = prefix_index(
+        {
+            "ex": "http://example.org/",
+            "exv": "http://example.org/vocab/",
+            "dup": "http://example.org/vocab/",
+            "empty": "",
+        }
+    )
+
+    assert to_qname("http://example.org/vocab/Thing", index) == "exv:Thing"
+    assert to_qname("http://example.org/Other", index) == "ex:Other"
+    assert to_qname("urn:x:1", index) is None
+
+
+def test_curie_map_compacts_on_first_lookup() -> None:
+    curies = CurieMap({"ex": "http://example.org/"})
+
+    assert curies["http://example.org/A"] == "ex:A"
+    assert curies["urn:x:1"] is None
+    assert dict(curies) == {"http://example.org/A": "ex:A", "urn:x:1": None}
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from owl2vault.file_writer import FileWriter
+
+
+def test_flush_makes_submitted_files_visible(tmp_path: Path) -> None:
+    target = tmp_path / "note.md"
+    with FileWriter() as writer:
+        writer.submit(target, "first\n")
+        writer.submit(target, "second ✓\n")
+        writer.flush()
+        assert target.read_text(encoding="utf-8") == "second ✓\n"
+
+
+def test_write_errors_are_raised_on_close(tmp_path: Path) -> None:
+    writer = FileWriter()
+    writer.submit(tmp_path / "missing" / "note.md", b"data")
+    with pytest.raises(FileNotFoundError):
+        writer.close()
+
+
+def test_every_worker_flushes_its_files(tmp_path: Path) -> None:
+    with FileWriter(workers=3) as writer:
+        for i in range(50):
+            writer.submit(tmp_path / f"{i}.md", f"note {i}\n")
+        writer.flush()
+        assert sorted(p.read_text(encoding="utf-8") for p in tmp_path.iterdir()) == sorted(
+            f"note {i}\n" for i in range(50)
+        )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import yaml
+
+from owl2vault.linkml_writer import model_to_linkml, write_linkml_yaml
+from owl2vault.model import OClass, ODatatype, OModel, OProperty, OSlot
+
+
+def _model() -> OModel:
+    om = OModel(ontology_iri="http://example.org/", prefixes={"ex": "http://example.org/"})
+    om.datatypes["http://www.w3.org/2001/XMLSchema#string"] = ODatatype(
+        iri="http://www.w3.org/2001/XMLSchema#string",
+        label="string",
+        base_iri="http://www.w3.org/2001/XMLSchema#string",
+        description=None,
+    )
+    name_slot = OSlot(
+        iri="http://example.org/name",
+        name="name",
+        description="A long description " * 8,
+        range_iri="http://www.w3.org/2001/XMLSchema#string",
+        range_label="string",
+        is_object=False,
+        min_card=1,
+        max_card=1,
+    )
+    om.properties[name_slot.iri] = OProperty(iri=name_slot.iri, label="name", description=None, kind="data")
+    om.classes["http://example.org/A"] = OClass(
+        iri="http://example.org/A", label="Thing", description="first", slots=[name_slot]
+    )
+    om.classes["http://example.org/B"] = OClass(
+        iri="http://example.org/B", label="Other", description=None, super_iris=["http://example.org/A"]
+    )
+    om.classes["http://example.org/C"] = OClass(iri="http://example.org/C", label="Thing", description="second")
+    return om
+
+
+def test_streamed_yaml_matches_schema_dict(tmp_path: Path) -> None:
+    om = _model()
+    out = tmp_path / "schema.yaml"
+    write_linkml_yaml(om, str(out))
+
+    loaded = yaml.safe_load(out.read_text(encoding="utf-8"))
+    assert loaded == model_to_linkml(om)
+    assert list(loaded["classes"]) == ["Thing", "Other"]
+    assert loaded["classes"]["Thing"]["description"] == "second"
+    assert loaded["enums"] == {}
+
+
+def test_empty_model_writes_empty_sections(tmp_path: Path) -> None:
+    out = tmp_path / "schema.yaml"
+    write_linkml_yaml(OModel(ontology_iri=None), str(out))
+
+    loaded = yaml.safe_load(out.read_text(encoding="utf-8"))
+    assert loaded == model_to_linkml(OModel(ontology_iri=None))
+    assert loaded["classes"] == {}
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from rdflib import BNode, Graph, Literal, Namespace
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDF, RDFS
+
+from owl2vault.loader import load_owl
+
+EX = Namespace("http://example.org/")
+
+
+def _graph(*triples) -> Graph:
+    """A graph holding ``triples``, added in one ``addN`` batch."""
+
+    g = Graph()
+    g.addN((s, p, o, g) for s, p, o in triples)
+    return g
+
+
+def _load(graph: Graph, tmp_path: Path):
+    # N-Triples serializes much faster than Turtle and the loader picks it by extension.
+    owl_file = tmp_path / "schema.nt"
+    owl_file.write_bytes(graph.serialize(format="nt", encoding="utf-8"))
+    return load_owl(str(owl_file))
+
+
+def test_object_property_assertions_are_not_annotations(tmp_path: Path) -> None:
+    g = _graph(
+        (EX.Person, RDF.type, OWL.Class),
+        (EX.knows, RDF.type, OWL.ObjectProperty),
+        (EX.note, RDF.type, OWL.AnnotationProperty),
+        (EX.alice, RDF.type, OWL.NamedIndividual),
+        (EX.bob, RDF.type, OWL.NamedIndividual),
+        (EX.alice, EX.knows, EX.bob),
+        (EX.alice, EX.note, Literal("hello")),
+    )
+
+    model = _load(g, tmp_path)
+
+    alice = model.individuals[str(EX.alice)]
+    assert alice.annotations == {str(EX.note): [("hello", False)]}
+
+
+def test_property_inverses_are_collected_in_both_directions(tmp_path: Path) -> None:
+    g = _graph(
+        (EX.hasPart, RDF.type, OWL.ObjectProperty),
+        (EX.partOf, RDF.type, OWL.ObjectProperty),
+        (EX.partOf, RDFS.label, Literal("part of")),
+        (EX.hasPart, OWL.inverseOf, EX.partOf),
+    )
+
+    model = _load(g, tmp_path)
+
+    assert model.properties[str(EX.hasPart)].inverse_iris == [str(EX.partOf)]
+    assert model.properties[str(EX.partOf)].inverse_iris == [str(EX.hasPart)]
+    assert model.properties[str(EX.partOf)].label == "part of"
+
+
+def test_one_of_members_keep_list_order(tmp_path: Path) -> None:
+    members = [EX.red, EX.green, EX.blue]
+    head = BNode()
+    g = _graph(
+        (EX.Colour, RDF.type, OWL.Class),
+        (EX.Colour, OWL.oneOf, head),
+        (EX.green, RDFS.label, Literal("Green value")),
+    )
+    Collection(g, head, members)
+
+    model = _load(g, tmp_path)
+
+    enum = model.enums[str(EX.Colour)]
+    assert [value.iri for value in enum.values] == [str(m) for m in members]
+    assert [value.code for value in enum.values] == ["red", "Green_value", "blue"]
+
+
+def test_turtle_content_with_owl_extension_is_detected(tmp_path: Path) -> None:
+    owl_file = tmp_path / "schema.owl"
+    owl_file.write_text(
+        "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+        "<http://example.org/Thing> a owl:Class .\n",
+        encoding="utf-8",
+    )
+
+    model = load_owl(str(owl_file))
+
+    assert list(model.classes) == [str(EX.Thing)]
+
+
+def test_turtle_behind_a_long_comment_header_is_detected(tmp_path: Path) -> None:
+    owl_file = tmp_path / "schema.owl"
+    licence = "".join(f"# Licence line {i}: {'x' * 60}\n" for i in range(20))
+    owl_file.write_text(
+        licence + "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+        "<http://example.org/Thing> a owl:Class .\n",
+        encoding="utf-8",
+    )
+
+    model = load_owl(str(owl_file))
+
+    assert list(model.classes) == [str(EX.Thing)]
+
+
+def test_rdf_xml_after_a_comment_without_extension_is_detected(tmp_path: Path) -> None:
+    owl_file = tmp_path / "schema"
+    owl_file.write_text(
+        "<!-- Exported ontology\n     with a multi-line comment -->\n"
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"\n'
+        '         xmlns:owl="http://www.w3.org/2002/07/owl#">\n'
+        '  <owl:Class rdf:about="http://example.org/Thing"/>\n'
+        "</rdf:RDF>\n",
+        encoding="utf-8",
+    )
+
+    model = load_owl(str(owl_file))
+
+    assert list(model.classes) == [str(EX.Thing)]
+
+
+def test_inconclusive_sniff_falls_back_to_the_other_format(tmp_path: Path) -> None:
+    owl_file = tmp_path / "schema.owl"
+    owl_file.write_text(
+        "<http://example.org/Thing> a <http://www.w3.org/2002/07/owl#Class> .\n",
+        encoding="utf-8",
+    )
+
+    model = load_owl(str(owl_file))
+
+    assert list(model.classes) == [str(EX.Thing)]
+
+
+def test_instances_of_model_classes_are_individuals(tmp_path: Path) -> None:
+    g = _graph(
+        (EX.Person, RDF.type, OWL.Class),
+        (EX.alice, RDF.type, EX.Person),
+        (EX.bob, RDF.type, OWL.NamedIndividual),
+        (EX.rex, RDF.type, EX.Dog),
+    )
+
+    model = _load(g, tmp_path)
+
+    assert set(model.individuals) == {str(EX.alice), str(EX.bob)}
+    assert model.individuals[str(EX.alice)].types == [str(EX.Person)]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import yaml
+
+from owl2vault.mkdocs_writer import _mkdocs_yaml, write_mkdocs_docs
+from owl2vault.model import OClass, OIndividual, OModel, OSlot
+
+
+def _model(count: int) -> OModel:
+    om = OModel(ontology_iri="http://example.org/", prefixes={"ex": "http://example.org/"})
+    for i in range(count):
+        iri = f"http://example.org/C{i}"
+        om.classes[iri] = OClass(iri=iri, label=f"C{i}", description=None)
+        ind_iri = f"http://example.org/i{i}"
+        om.individuals[ind_iri] = OIndividual(iri=ind_iri, label=f"i{i}", description=None, types=[iri])
+    return om
+
+
+def test_directories_are_created_once_not_per_page(tmp_path: Path, monkeypatch) -> None:
+    created: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def _mkdir(self: Path, *args, **kwargs) -> None:
+        created.append(self)
+        original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", _mkdir)
+    write_mkdocs_docs(_model(1), str(tmp_path / "small"))
+    small_calls = len(created)
+    created.clear()
+    write_mkdocs_docs(_model(25), str(tmp_path / "large"))
+
+    assert len(created) == small_calls
+    assert len(list((tmp_path / "large" / "docs" / "classes").iterdir())) == 25
+
+
+def test_mkdocs_yaml_matches_safe_dump_round_trip() -> None:
+    labels = [
+        "Alpha", "Long: thing #1", "true", "1.5", "it's", "- dash", "", "tab\there", "Ünïcode", "trailing:",
+        # Control characters force double quotes; astral characters must survive them.
+        "Label\n\U0001F600", "bell\x07 \u2028 \U0001F600",
+    ]
+    nav = [
+        {"Home": "index.md"},
+        {"Classes": [{label: f"classes/c{i}.md"} for i, label in enumerate(labels)]},
+    ]
+    text = _mkdocs_yaml("http://example.org/", nav)
+
+    assert yaml.safe_load(text) == {
+        "site_name": "http://example.org/",
+        "theme": {"name": "material"},
+        "plugins": ["graph", "search", "optimize"],
+        "nav": nav,
+    }
+
+
+def test_slot_descriptions_cannot_break_the_properties_table(tmp_path: Path) -> None:
+    om = _model(1)
+    om.classes["http://example.org/C0"].slots.append(
+        OSlot(
+            iri="http://example.org/p",
+            name="p",
+            description="either a | b\nor c",
+            range_iri="http://www.w3.org/2001/XMLSchema#string",
+            range_label="string",
+            is_object=False,
+        )
+    )
+    write_mkdocs_docs(om, str(tmp_path))
+
+    (page,) = (tmp_path / "docs" / "classes").iterdir()
+    rows = [line for line in page.read_text(encoding="utf-8").splitlines() if line.startswith("| p |")]
+    assert rows == ["| p | string |  | either a \\| b or c |"]
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import dataclasses
+
+import owl2vault.model as model
+
+
+def test_model_records_use_slots() -> None:
+    for name in model.__all__:
+        cls = getattr(model, name)
+        assert dataclasses.is_dataclass(cls)
+        assert "__slots__" in cls.__dict__, name
+        assert "__dict__" not in cls.__dict__, name
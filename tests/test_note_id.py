@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import re
 
-from owl2vault.note_id import iri_to_note_id
+from owl2vault.note_id import iri_to_note_id, iri_to_note_ids
+
+_NOTE_ID_RE = re.compile(r"[A-Za-z0-9_]+__[0-9a-f]+")
 
 
 def test_same_iri_same_id() -> None:
@@ -19,4 +21,27 @@ def test_different_namespaces_yield_different_ids() -> None:
 def test_output_characters() -> None:
     iri = "http://example.org/some path/Item#Fragment"
     note_id = iri_to_note_id(iri)
-    assert re.fullmatch(r"[A-Za-z0-9_]+__[0-9a-f]+", note_id)
+    assert _NOTE_ID_RE.fullmatch(note_id)
+
+
+def test_bulk_ids_match_single_ids() -> None:
+    iris = ["http://example.org/A", "http://example.org/ns#B", "http://example.org/A"]
+    assert iri_to_note_ids(iris) == {iri: iri_to_note_id(iri) for iri in iris}
+
+
+def test_readable_base_matches_urlparse_split() -> None:
+    assert iri_to_note_id("http://example.org/onto/Thing").startswith("Thing__")
+    assert iri_to_note_id("http://example.org/onto/").startswith("onto__")
+    assert iri_to_note_id("http://example.org").startswith("example_org__")
+    assert iri_to_note_id("http://example.org/a#Frag").startswith("Frag__")
+    assert iri_to_note_id("http://example.org/a?x=1").startswith("a__")
+    assert iri_to_note_id("urn:isbn:123").startswith("isbn_123__")
+
+
+def test_repeated_iris_are_served_from_the_cache() -> None:
+    iri = "http://example.org/cached#Thing"
+    first = iri_to_note_id(iri)
+    hits = iri_to_note_id.cache_info().hits
+
+    assert iri_to_note_id(iri) is first
+    assert iri_to_note_id.cache_info().hits == hits + 1
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import yaml
+
+from owl2vault.model import OClass, OModel
+from owl2vault.obsidian_writer import write_obsidian_vault
+
+
+def _front_matter(note: Path) -> dict:
+    _, front, _ = note.read_text(encoding="utf-8").split("---\n", 2)
+    return yaml.safe_load(front)
+
+
+def test_front_matter_loads_back_to_the_note_fields(tmp_path: Path) -> None:
+    om = OModel(ontology_iri=None, prefixes={"ex": "http://example.org/"})
+    labels = {
+        "http://example.org/A": "Alpha",
+        "http://example.org/B": "Long: thing #1",
+        "http://other.org/C": "true",
+        "http://other.org/D": "it's Ünïcode",
+    }
+    for iri, label in labels.items():
+        om.classes[iri] = OClass(iri=iri, label=label, description=None)
+    write_obsidian_vault(om, str(tmp_path))
+
+    seen = {}
+    for note in (tmp_path / "Classes").iterdir():
+        front = _front_matter(note)
+        assert front["note_id"] == note.stem
+        assert front["type"] == "class" and front["tags"] == ["class"]
+        seen[front["iri"]] = (front["label"], front["curie"])
+
+    assert seen == {
+        "http://example.org/A": ("Alpha", "ex:A"),
+        "http://example.org/B": ("Long: thing #1", "ex:B"),
+        "http://other.org/C": ("true", None),
+        "http://other.org/D": ("it's Ünïcode", None),
+    }
+    assert _front_matter(tmp_path / "00-Index" / "Index.md") == {"type": "index", "label": "Index", "tags": ["index"]}
+
+
+def test_front_matter_keeps_control_and_astral_characters(tmp_path: Path) -> None:
+    om = OModel(ontology_iri=None, prefixes={"ex": "http://example.org/"})
+    iri = "http://example.org/Smile\U0001F600"
+    label = "Line one\nLine two \U0001F600\x07"
+    om.classes[iri] = OClass(iri=iri, label=label, description=None)
+    write_obsidian_vault(om, str(tmp_path))
+
+    (note,) = (tmp_path / "Classes").iterdir()
+    front = _front_matter(note)
+    assert front["iri"] == iri
+    assert front["label"] == label
+    assert front["curie"] == "ex:Smile\U0001F600"
+
+
+def test_index_sorts_classes_by_label_alone(tmp_path: Path) -> None:
+    om = OModel(ontology_iri=None)
+    for iri, label in (("http://example.org/zzz", ""), ("http://example.org/a", "Beta"), ("http://example.org/b", "alpha")):
+        om.classes[iri] = OClass(iri=iri, label=label, description=None)
+    write_obsidian_vault(om, str(tmp_path))
+
+    index = (tmp_path / "00-Index" / "Index.md").read_text(encoding="utf-8")
+    classes = index.split("## Classes\n", 1)[1].split("\n\n", 1)[0].splitlines()
+    # An empty label sorts first, as it always has, rather than under its IRI.
+    assert [line.rsplit("|", 1)[1] for line in classes] == ["]]", "alpha]]", "Beta]]"]
+
+
+def test_curies_use_the_longest_matching_prefix(tmp_path: Path) -> None:
+    om = OModel(
+        ontology_iri=None,
+        prefixes={"ex": "http://example.org/", "exv": "http://example.org/vocab/", "empty": ""},
+    )
+    for iri in ("http://example.org/vocab/Thing", "http://example.org/Other"):
+        om.classes[iri] = OClass(iri=iri, label=iri.rsplit("/", 1)[1], description=None)
+    write_obsidian_vault(om, str(tmp_path))
+
+    curies = {_front_matter(note)["label"]: _front_matter(note)["curie"] for note in (tmp_path / "Classes").iterdir()}
+    assert curies == {"Thing": "exv:Thing", "Other": "ex:Other"}
+
+
+def test_notes_are_utf8_with_lf_line_endings(tmp_path: Path) -> None:
+    om = OModel(ontology_iri=None, prefixes={"ex": "http://example.org/"})
+    om.classes["http://example.org/A"] = OClass(iri="http://example.org/A", label="Ärger", description=None)
+    write_obsidian_vault(om, str(tmp_path))
+
+    (note,) = (tmp_path / "Classes").iterdir()
+    data = note.read_bytes()
+    assert b"\r\n" not in data
+    assert "# Ärger\n".encode("utf-8") in data
+
+
+def test_vault_folders_are_created_once_not_per_note(tmp_path: Path, monkeypatch) -> None:
+    created: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def _mkdir(self: Path, *args, **kwargs) -> None:
+        created.append(self)
+        original_mkdir(self, *args, **kwargs)
+
+    def _model(count: int) -> OModel:
+        om = OModel(ontology_iri=None, prefixes={})
+        for i in range(count):
+            iri = f"http://example.org/C{i}"
+            om.classes[iri] = OClass(iri=iri, label=f"C{i}", description=None)
+        return om
+
+    monkeypatch.setattr(Path, "mkdir", _mkdir)
+    write_obsidian_vault(_model(1), str(tmp_path / "small"))
+    small_calls = len(created)
+    created.clear()
+    write_obsidian_vault(_model(25), str(tmp_path / "large"))
+
+    assert len(created) == small_calls
+    assert len(list((tmp_path / "large" / "Classes").iterdir())) == 25
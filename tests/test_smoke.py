@@ -1,131 +1,112 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Any, Callable, Dict, Protocol, Tuple
 
-from rdflib import BNode, Graph, Literal, Namespace
-from rdflib.collection import Collection
-from rdflib.namespace import OWL, RDF, RDFS, XSD
-import yaml
+import pytest
+from rdflib import Graph
 
-from owl2vault.linkml_writer import write_linkml_yaml
 from owl2vault.loader import load_owl
-from owl2vault.obsidian_writer import write_obsidian_vault
-from owl2vault.mkdocs_writer import write_mkdocs_docs
-from owl2vault.docsify_writer import write_docsify_docs
-from owl2vault.hugo_writer import write_hugo_site
-
-
-def _build_graph() -> Graph:
-    g = Graph()
-    ex = Namespace("http://example.org/")
-    g.bind("ex", ex)
-
-    cls_a = ex.ClassA
-    cls_b = ex.ClassB
-    g.add((cls_a, RDF.type, OWL.Class))
-    g.add((cls_a, RDFS.label, Literal("Class A")))
-    g.add((cls_b, RDF.type, OWL.Class))
-    g.add((cls_b, RDFS.label, Literal("Class B")))
-    g.add((cls_b, RDFS.subClassOf, cls_a))
-
-    prop = ex.hasName
-    g.add((prop, RDF.type, OWL.DatatypeProperty))
-    g.add((prop, RDFS.label, Literal("Has Name")))
-    restriction = BNode()
-    g.add((cls_a, RDFS.subClassOf, restriction))
-    g.add((restriction, RDF.type, OWL.Restriction))
-    g.add((restriction, OWL.onProperty, prop))
-    g.add((restriction, OWL.someValuesFrom, XSD.string))
-    g.add((restriction, OWL.minCardinality, Literal(1)))
-
-    ann_prop = ex.note
-    g.add((ann_prop, RDF.type, OWL.AnnotationProperty))
-    g.add((ann_prop, RDFS.label, Literal("Note")))
-    g.add((ann_prop, RDFS.domain, cls_a))
-    g.add((ann_prop, RDFS.range, XSD.string))
-    g.add((cls_a, ann_prop, Literal("Example note")))
-    g.add((cls_a, ann_prop, prop))
-
-    # Individual (not explicitly typed as NamedIndividual)
-    ind = ex.Instance1
-    g.add((ind, RDF.type, cls_a))
-    g.add((ind, RDFS.label, Literal("Instance 1")))
-
-    color = ex.Color
-    g.add((color, RDF.type, OWL.Class))
-    g.add((color, RDFS.label, Literal("Color")))
-    one_of = BNode()
-    members = [ex.Red, ex.Blue]
-    Collection(g, one_of, members)
-    g.add((color, OWL.oneOf, one_of))
-    g.add((ex.Red, RDFS.label, Literal("Red")))
-    g.add((ex.Blue, RDFS.label, Literal("Blue")))
-
-    return g
-
-
-def test_end_to_end(tmp_path: Path) -> None:
-    graph = _build_graph()
-    owl_file = tmp_path / "schema.owl"
-    graph.serialize(destination=str(owl_file), format="turtle")
+from owl2vault.model import OModel
+from owl2vault.note_id import iri_to_note_id
+
+
+class BuiltOutputs(Protocol):
+    """Read-only view of the session ``built_outputs`` fixture from conftest."""
+
+    @property
+    def linkml(self) -> Path: ...
+
+    @property
+    def vault(self) -> Path: ...
+
+    @property
+    def mkdocs(self) -> Path: ...
+
+    @property
+    def docsify(self) -> Path: ...
+
+    @property
+    def hugo(self) -> Path: ...
+
 
-    model = load_owl(str(owl_file))
+# Every writer names the Class A page after its note ID.
+CLASS_A_ID = iri_to_note_id("http://example.org/ClassA")
+HAS_NAME_ID = iri_to_note_id("http://example.org/hasName")
+
+VAULT_DIRS = {
+    "Classes",
+    "Enums",
+    "Object_Properties",
+    "Data_Properties",
+    "Annotation_Properties",
+    "Datatypes",
+    "Individuals",
+    "00-Index",
+}
+
+
+def test_load(model: OModel) -> None:
     assert model.classes
     assert model.enums
 
-    linkml_path = tmp_path / "schema.yaml"
-    write_linkml_yaml(model, str(linkml_path))
-    assert linkml_path.exists()
-
-    vault_dir = tmp_path / "vault"
-    write_obsidian_vault(model, str(vault_dir))
-    assert (vault_dir / "Classes").is_dir()
-    assert (vault_dir / "Enums").is_dir()
-    assert (vault_dir / "Object_Properties").is_dir()
-    assert (vault_dir / "Data_Properties").is_dir()
-    assert (vault_dir / "Annotation_Properties").is_dir()
-    assert (vault_dir / "Datatypes").is_dir()
-    assert (vault_dir / "Individuals").is_dir()
+
+def test_load_from_file_matches_graph(tmp_path: Path, smoke_graph: Tuple[Graph, bytes], model: OModel) -> None:
+    _, turtle_bytes = smoke_graph
+    owl_file = tmp_path / "schema.owl"
+    owl_file.write_bytes(turtle_bytes)
+
+    loaded = load_owl(str(owl_file))
+    assert set(loaded.classes) == set(model.classes)
+    assert set(loaded.enums) == set(model.enums)
+    assert set(loaded.properties) == set(model.properties)
+    assert set(loaded.individuals) == set(model.individuals)
+
+
+def test_linkml(built_outputs: BuiltOutputs) -> None:
+    assert built_outputs.linkml.exists()
+
+
+YamlLoad = Callable[[str], Any]
+
+
+def _assert_vault(vault_dir: Path, _: YamlLoad) -> None:
+    with os.scandir(vault_dir) as it:
+        subdirs = {entry.name for entry in it if entry.is_dir()}
+    assert VAULT_DIRS <= subdirs
     assert (vault_dir / "00-Index" / "Index.md").exists()
-    class_a_note = ""
-    for note in (vault_dir / "Classes").glob("*.md"):
-        text = note.read_text()
-        if "# Class A" in text:
-            class_a_note = text
-            break
-    assert class_a_note
-    assert "## Properties" in class_a_note
-    assert "- Note: Example note" in class_a_note
-    assert "Note: [[hasName" in class_a_note and "Has Name]]" in class_a_note
-
-    mkdocs_dir = tmp_path / "mkdocs"
-    write_mkdocs_docs(model, str(mkdocs_dir))
+    class_a_path = vault_dir / "Classes" / f"{CLASS_A_ID}.md"
+    assert class_a_path.exists()
+    lines = set(class_a_path.read_text().splitlines())
+    assert "# Class A" in lines
+    assert "## Properties" in lines
+    assert "- Note: Example note" in lines
+    assert f"- Note: [[{HAS_NAME_ID}|Has Name]]" in lines
+
+
+def _assert_mkdocs(mkdocs_dir: Path, yaml_load: YamlLoad) -> None:
     docs_root = mkdocs_dir / "docs"
     assert (docs_root / "index.md").exists()
     assert (mkdocs_dir / "mkdocs.yml").exists()
-    cfg = yaml.safe_load((mkdocs_dir / "mkdocs.yml").read_text())
+    cfg = yaml_load((mkdocs_dir / "mkdocs.yml").read_text())
     assert cfg.get("theme", {}).get("name") == "material"
     assert cfg.get("plugins") == ["graph", "search", "optimize"]
-    class_docs = list((docs_root / "classes").glob("*.md"))
-    content = ""
-    for doc in class_docs:
-        text = doc.read_text()
-        if text.startswith("# Class A"):
-            content = text
-            break
-    assert content
-    assert "## Properties" in content
-    assert "- Note: [Has Name]" in content
-
-    docsify_dir = tmp_path / "docsify"
-    write_docsify_docs(model, str(docsify_dir))
+    content = (docs_root / "classes" / f"{CLASS_A_ID}.md").read_text()
+    assert content.startswith("# Class A")
+    lines = set(content.splitlines())
+    assert "## Properties" in lines
+    assert f"- Note: [Has Name](../data_properties/{HAS_NAME_ID}.md)" in lines
+
+
+def _assert_docsify(docsify_dir: Path, _: YamlLoad) -> None:
     docsify_docs = docsify_dir / "docs"
     assert (docsify_dir / "index.html").exists()
     assert (docsify_docs / "README.md").exists()
     assert (docsify_docs / "_sidebar.md").exists()
 
-    hugo_dir = tmp_path / "hugo"
-    write_hugo_site(model, str(hugo_dir))
+
+def _assert_hugo(hugo_dir: Path, _: YamlLoad) -> None:
     hugo_content = hugo_dir / "content"
     assert (hugo_dir / "hugo.toml").exists()
     assert (hugo_content / "_index.md").exists()
@@ -134,7 +115,28 @@ def test_end_to_end(tmp_path: Path) -> None:
     classes_index = (hugo_content / "classes" / "_index.md").read_text()
     assert 'type = "chapter"' in classes_index
     assert not classes_index.lstrip().startswith("# ")
-    class_page = next((hugo_content / "classes").glob("*.md"))
-    class_text = class_page.read_text()
+    class_text = (hugo_content / "classes" / f"{CLASS_A_ID}.md").read_text()
     assert 'type = "default"' in class_text
     assert not class_text.lstrip().startswith("# ")
+
+
+_SITE_CHECKS: Dict[str, Callable[[Path, YamlLoad], None]] = {
+    "vault": _assert_vault,
+    "mkdocs": _assert_mkdocs,
+    "docsify": _assert_docsify,
+    "hugo": _assert_hugo,
+}
+
+
+@pytest.mark.parametrize("backend", list(_SITE_CHECKS))
+def test_site_output(backend: str, built_outputs: BuiltOutputs, yaml_load: YamlLoad) -> None:
+    _SITE_CHECKS[backend](getattr(built_outputs, backend), yaml_load)
+
+
+def test_hugo_config_is_valid_toml(built_outputs: BuiltOutputs, model: OModel) -> None:
+    tomllib = pytest.importorskip("tomllib")
+
+    config = tomllib.loads((built_outputs.hugo / "hugo.toml").read_text(encoding="utf-8"))
+    assert config["title"] == (model.ontology_iri or "owl2vault docs")
+    assert config["baseURL"] == "/"
+
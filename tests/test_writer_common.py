@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from owl2vault import _writer_common
+from owl2vault._writer_common import format_cardinality
+
+
+def test_cardinality_fast_path_matches_general_formatting(monkeypatch) -> None:
+    pairs = [(None, None), (0, 1), (1, 1), (None, 1), (0, None), (1, None), (2, 5), (None, 3), (3, 3), (2, None)]
+    cached = [format_cardinality(lo, hi) for lo, hi in pairs]
+
+    monkeypatch.setattr(_writer_common, "_CARDINALITY_TEXT", {})
+    assert cached == [format_cardinality(lo, hi) for lo, hi in pairs]
+    assert cached[:4] == ["", "0..1", "1", "0..1"]